@@ -0,0 +1,621 @@
+import argparse
+import asyncio
+import http.server
+import json
+import os
+import random
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SCRAPER = os.path.join(_HERE, "scrape_melbet_games.py")
+
+_LAUNCHER_PATHS = [
+    "/api/games?limit=50",
+    "/api/games?q=fruit",
+    "/api/games?q=book%20of&limit=20",
+    "/api/games?q=party&offset=50",
+    "/api/games?has_demo=1&limit=50",
+    "/api/games?q=a&limit=10",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait_for_port(host: str, port: int, proc: subprocess.Popen, timeout_s: float = 60.0) -> None:
+    deadline = time.time() + timeout_s
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"launcher exited with status {proc.returncode}")
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"launcher did not start listening on {host}:{port}")
+
+
+def _start_launcher(server: str, catalog: str, port: int) -> subprocess.Popen:
+    cmd = [
+        sys.executable,
+        _SCRAPER,
+        "--serve",
+        "--server",
+        server,
+        "--port",
+        str(port),
+        "--catalog",
+        catalog,
+        "--reload-interval",
+        "0",
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _wait_for_port("127.0.0.1", port, proc)
+    return proc
+
+
+async def _load(host: str, port: int, paths: List[str], total: int, concurrency: int) -> Tuple[List[float], int, float]:
+    """Sends `total` GETs over `concurrency` connections, reusing each while the server allows it."""
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def _client() -> None:
+        nonlocal errors
+        reader: Optional[asyncio.StreamReader] = None
+        writer: Optional[asyncio.StreamWriter] = None
+        for n in counter:
+            path = paths[n % len(paths)]
+            t0 = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(host, port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\n\r\n".encode("latin-1"))
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                headers: Dict[str, str] = {}
+                for line in head.decode("latin-1").split("\r\n")[1:]:
+                    name, sep, value = line.partition(":")
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+                    reusable = headers.get("connection", "").lower() != "close" and not head.startswith(b"HTTP/1.0")
+                else:
+                    await reader.read()
+                    reusable = False
+                if not head.startswith((b"HTTP/1.0 200", b"HTTP/1.1 200")):
+                    errors += 1
+            except (OSError, asyncio.IncompleteReadError):
+                errors += 1
+                reusable = False
+            latencies.append(time.perf_counter() - t0)
+            if not reusable and writer is not None:
+                writer.close()
+                reader = writer = None
+        if writer is not None:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client() for _ in range(max(1, concurrency))))
+    return latencies, errors, time.perf_counter() - t0
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def _report(label: str, latencies: List[float], errors: int, elapsed_s: float) -> None:
+    lat = sorted(latencies)
+    sys.stdout.write(
+        f"{label:<12} {len(lat):>7} req  {len(lat) / elapsed_s:>8.0f} req/s  "
+        f"p50 {_percentile(lat, 0.50) * 1e3:7.2f} ms  p99 {_percentile(lat, 0.99) * 1e3:7.2f} ms  "
+        f"max {lat[-1] * 1e3 if lat else 0.0:7.2f} ms  errors {errors}\n"
+    )
+
+
+def _bench_launcher(args: argparse.Namespace) -> int:
+    paths = args.path or _LAUNCHER_PATHS
+    if args.url:
+        host, _, port = args.url.split("//", 1)[-1].rstrip("/").partition(":")
+        asyncio.run(_load(host, int(port or 80), paths, args.warmup, args.concurrency))
+        latencies, errors, elapsed = asyncio.run(_load(host, int(port or 80), paths, args.requests, args.concurrency))
+        _report(args.url, latencies, errors, elapsed)
+        return 0
+
+    for server in args.servers:
+        port = _free_port()
+        proc = _start_launcher(server, args.catalog, port)
+        try:
+            asyncio.run(_load("127.0.0.1", port, paths, args.warmup, args.concurrency))
+            latencies, errors, elapsed = asyncio.run(_load("127.0.0.1", port, paths, args.requests, args.concurrency))
+            _report(server, latencies, errors, elapsed)
+        finally:
+            proc.terminate()
+            proc.wait()
+    return 0
+
+
+# --- local stand-in for the MelBet API -------------------------------------
+
+
+def _api_game(g: Dict[str, Any]) -> Dict[str, Any]:
+    """A scraped game record turned back into the games/1 response shape."""
+    return {
+        "id": g.get("id"),
+        "name": g.get("name"),
+        "brandId": g.get("brand_id"),
+        "brandName": g.get("brand_name"),
+        "provider_id": g.get("provider_id"),
+        "product_id": g.get("product_id"),
+        "categories": list(g.get("categories") or []),
+        "has_demo": g.get("has_demo"),
+        "is_new": g.get("is_new"),
+        "is_promo": g.get("is_promo"),
+        "is_hot": g.get("is_hot"),
+        "img": g.get("img"),
+    }
+
+
+def _synthetic_api_games(n: int, catalog: str) -> List[Dict[str, Any]]:
+    """`n` distinct API game records cycled from a scraped catalog."""
+    with open(catalog, "r", encoding="utf-8") as f:
+        source = [g for g in json.load(f) if isinstance(g, dict)]
+    if not source:
+        raise SystemExit(f"{catalog}: no games to replay")
+    out = []
+    for i in range(n):
+        g = _api_game(source[i % len(source)])
+        g["id"] = 1_000_000 + i
+        g["name"] = f"{g['name']} #{i}"
+        out.append(g)
+    return out
+
+
+def _recorded_responses(cache_path: str) -> Dict[str, bytes]:
+    """path?query -> body for every response stored in a --cache SQLite file."""
+    if not os.path.exists(cache_path):
+        raise SystemExit(f"{cache_path}: no such cache file")
+    db = sqlite3.connect(cache_path)
+    try:
+        rows = db.execute("SELECT key, body FROM responses").fetchall()
+    finally:
+        db.close()
+    out: Dict[str, bytes] = {}
+    for key, body in rows:
+        parts = urlparse(key.rsplit(" lang=", 1)[0])
+        out[f"{parts.path}?{parts.query}" if parts.query else parts.path] = bytes(body)
+    return out
+
+
+class _FakeApi:
+    def __init__(
+        self,
+        games: List[Dict[str, Any]],
+        recorded: Optional[Dict[str, bytes]] = None,
+        latency_s: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 1,
+        max_limit: int = 0,
+        rate_limit: float = 0.0,
+        latency_per_game_s: float = 0.0,
+    ):
+        self.games = games
+        self.recorded = recorded or {}
+        self.latency_s = latency_s
+        self.error_rate = error_rate
+        self.max_limit = max_limit
+        self.rate_limit = rate_limit
+        self.latency_per_game_s = latency_per_game_s
+        self.by_category: Dict[int, List[Dict[str, Any]]] = {}
+        for g in games:
+            for cid in g.get("categories") or []:
+                self.by_category.setdefault(int(cid), []).append(g)
+        self.options = json.dumps(
+            {"subcategories": [{"id": cid, "name": f"Category {cid}", "parentId": 0} for cid in sorted(self.by_category)]}
+        ).encode("utf-8")
+        self.counts = {"requests": 0, "errors": 0, "replayed": 0, "throttled": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window: List[float] = []
+
+    def _over_rate(self) -> bool:
+        # Sliding one-second window of accepted API requests.
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.rate_limit:
+                self.counts["throttled"] += 1
+                return True
+            self._window.append(now)
+        return False
+
+    def respond(self, target: str, lang: str = "en") -> Tuple[int, str, bytes]:
+        with self._lock:
+            self.counts["requests"] += 1
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+            if fail:
+                self.counts["errors"] += 1
+        parts = urlparse(target)
+        if parts.path == "/stats":
+            return 200, "application/json", json.dumps(self.counts).encode("utf-8")
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        if parts.path.endswith("/slots"):
+            return 200, "text/html", b"<!doctype html><html><body>slots</body></html>"
+        if self.rate_limit > 0 and self._over_rate():
+            return 429, "application/json", b'{"error": "rate limited"}'
+        if fail:
+            return 503, "application/json", b'{"error": "injected"}'
+        body = self.recorded.get(target)
+        if body is not None:
+            with self._lock:
+                self.counts["replayed"] += 1
+            return 200, "application/json", body
+        if parts.path == "/web-api/tpmodels/options/1":
+            return 200, "application/json", self.options
+        if parts.path == "/web-api/tpmodels/games/1":
+            qs = parse_qs(parts.query)
+            cid = (qs.get("categoriesId") or [""])[0]
+            offset = int((qs.get("offset") or ["0"])[0])
+            limit = int((qs.get("limit") or ["100"])[0])
+            if self.max_limit > 0:
+                limit = min(limit, self.max_limit)
+            selected = self.by_category.get(int(cid), []) if cid else self.games
+            page = selected[offset : offset + limit]
+            if lang != "en":
+                # Only names are localized, as on the real site.
+                page = [dict(g, name=f"{g['name']} [{lang}]") for g in page]
+            if self.latency_per_game_s:
+                time.sleep(self.latency_per_game_s * len(page))
+            return 200, "application/json", json.dumps({"games": page}, ensure_ascii=False).encode("utf-8")
+        return 404, "application/json", b"{}"
+
+
+class _FakeApiHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # One write per response: split header/body writes stall keep-alive
+    # clients on delayed ACKs.
+    wbufsize = 1 << 16
+
+    def do_GET(self) -> None:
+        lang = (self.headers.get("Accept-Language") or "en").split(",")[0].strip() or "en"
+        status, content_type, body = self.server.api.respond(self.path, lang)  # type: ignore[attr-defined]
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def _serve_fake_api(args: argparse.Namespace) -> int:
+    games = _synthetic_api_games(args.games, args.catalog)
+    recorded = _recorded_responses(args.replay) if args.replay else None
+    server = http.server.ThreadingHTTPServer((args.host, args.port), _FakeApiHandler)
+    server.daemon_threads = True
+    server.api = _FakeApi(  # type: ignore[attr-defined]
+        games,
+        recorded,
+        args.latency,
+        args.error_rate,
+        args.seed,
+        max_limit=args.max_limit,
+        rate_limit=args.rate_limit,
+        latency_per_game_s=args.latency_per_game,
+    )
+    sys.stdout.write(
+        f"Fake MelBet API on http://{args.host}:{server.server_address[1]}/ "
+        f"({len(games)} games, {len(recorded or {})} recorded responses)\n"
+    )
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+# --- crawler benchmark suite ------------------------------------------------
+
+# scrape-capped: the fake API caps pages at --limit while --adaptive grows
+# them past it; the crawl must still return every game.
+_SCRAPE_CASES = ["scrape", "scrape-capped", "parse", "store", "write-json", "write-jsonl", "write-csv", "write-melcat", "write-sqlite"]
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_case(args: argparse.Namespace) -> int:
+    """One benchmark case in a fresh process, so peak RSS is its own."""
+    sys.path.insert(0, _HERE)
+    import scrape_melbet_games as smg
+
+    base_url = "http://bench.invalid"
+    result: Dict[str, Any] = {"case": args.case, "games": args.games}
+    if args.case in ("scrape", "scrape-capped"):
+        controller = None
+        if args.case == "scrape-capped":
+            controller = smg._AdaptiveController(args.limit, max_limit=args.limit * 4)
+        t0, c0 = time.perf_counter(), time.process_time()
+        games = smg.scrape_games_http(
+            base_url=args.api_url,
+            lang="en",
+            category_ids=None,
+            all_categories=args.all_categories,
+            brand_ids=None,
+            title_search=None,
+            limit=args.limit,
+            max_games=0,
+            sleep_s=0.0,
+            retries=3,
+            backoff_s=0.05,
+            workers=args.workers,
+            controller=controller,
+        )
+        wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+        requests = smg._http_stats()["requests"]
+        result.update(items=len(games), requests=requests, rps=requests / wall if wall else 0.0)
+    else:
+        api_games = _synthetic_api_games(args.games, args.catalog)
+        pages = [{"games": api_games[i : i + args.limit]} for i in range(0, len(api_games), args.limit)]
+        if args.case == "parse":
+            t0, c0 = time.perf_counter(), time.process_time()
+            n = sum(len(smg._parse_games(page, base_url=base_url, lang="en")) for page in pages)
+            wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+            # Memory the parsed records hold on top of the API pages, traced
+            # over a sample so tracing skews neither the timing nor peak RSS.
+            import tracemalloc
+
+            sample = pages[: max(1, 10000 // args.limit)]
+            tracemalloc.start()
+            parsed = [smg._parse_games(page, base_url=base_url, lang="en") for page in sample]
+            held = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            sampled = sum(len(page_games) for page_games in parsed)
+            del parsed
+            result.update(
+                ns_per_game=wall / n * 1e9 if n else 0.0,
+                bytes_per_record=held / sampled if sampled else 0.0,
+            )
+        else:
+            parsed = [smg._parse_games(page, base_url=base_url, lang="en") for page in pages]
+            if args.case == "store":
+                # Every page is seen again under two more categories, as in
+                # an --all-categories crawl.
+                t0, c0 = time.perf_counter(), time.process_time()
+                store = smg._GameStore()
+                for cid in (1, 2, 3):
+                    for page_games in parsed:
+                        store.add(page_games, category_id=cid)
+                n = len(store.games())
+                wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+            else:
+                games = [g for page_games in parsed for g in page_games]
+                with tempfile.TemporaryDirectory() as tmp:
+                    fmt = args.case.split("-", 1)[1]
+                    path = os.path.join(tmp, f"games.{fmt}")
+                    t0, c0 = time.perf_counter(), time.process_time()
+                    if fmt == "json":
+                        smg._write_json(path, games)
+                    elif fmt == "csv":
+                        smg._write_csv(path, games)
+                    elif fmt == "melcat":
+                        smg._write_columnar(path, games)
+                    elif fmt == "sqlite":
+                        smg._write_catalog(path, games)
+                    else:
+                        with smg._StreamWriter(path, fmt) as writer:
+                            writer.write(games)
+                    wall, cpu = time.perf_counter() - t0, time.process_time() - c0
+                    result["bytes"] = os.path.getsize(path)
+                n = len(games)
+        result.update(items=n)
+    result.update(wall_s=wall, cpu_s=cpu, items_per_s=result["items"] / wall if wall else 0.0, peak_rss_mb=_peak_rss_mb())
+    sys.stdout.write(json.dumps(result) + "\n")
+    return 0
+
+
+def _start_fake_api(args: argparse.Namespace, games: int, port: int, max_limit: int = 0) -> subprocess.Popen:
+    cmd = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "fake-api",
+        "--port",
+        str(port),
+        "--games",
+        str(games),
+        "--catalog",
+        args.catalog,
+        "--latency",
+        str(args.latency),
+        "--error-rate",
+        str(args.error_rate),
+    ]
+    if max_limit:
+        cmd += ["--max-limit", str(max_limit)]
+    elif args.replay:
+        cmd += ["--replay", args.replay]
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    _wait_for_port("127.0.0.1", port, proc)
+    return proc
+
+
+def _case_process(args: argparse.Namespace, case: str, games: int, api_url: str = "") -> Dict[str, Any]:
+    cmd = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "run-case",
+        "--case",
+        case,
+        "--games",
+        str(games),
+        "--catalog",
+        args.catalog,
+        "--limit",
+        str(args.limit),
+        "--workers",
+        str(args.workers),
+    ]
+    if api_url:
+        cmd += ["--api-url", api_url]
+    if args.all_categories:
+        cmd.append("--all-categories")
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _bench_scrape(args: argparse.Namespace) -> int:
+    results: List[Dict[str, Any]] = []
+    config = {
+        "limit": args.limit,
+        "workers": args.workers,
+        "all_categories": args.all_categories,
+        "latency": args.latency,
+        "error_rate": args.error_rate,
+        "replay": bool(args.replay),
+    }
+    missing = 0
+    sys.stdout.write(f"{'case':<13} {'games':>7} {'wall s':>8} {'cpu s':>8} {'items/s':>10} {'req/s':>8} {'peak MB':>8}\n")
+    for games in args.sizes:
+        for case in args.cases:
+            if case in ("scrape", "scrape-capped"):
+                port = _free_port()
+                proc = _start_fake_api(args, games, port, max_limit=args.limit if case == "scrape-capped" else 0)
+                try:
+                    r = _case_process(args, case, games, f"http://127.0.0.1:{port}")
+                finally:
+                    proc.terminate()
+                    proc.wait()
+            else:
+                r = _case_process(args, case, games)
+            r["config"] = config
+            results.append(r)
+            rps = f"{r['rps']:8.0f}" if "rps" in r else f"{'':>8}"
+            sys.stdout.write(
+                f"{case:<13} {games:>7} {r['wall_s']:8.3f} {r['cpu_s']:8.3f} {r['items_per_s']:10.0f} {rps} {r['peak_rss_mb']:8.1f}\n"
+            )
+            if "ns_per_game" in r:
+                sys.stdout.write(f"{'':<13} {'':>7} {r['ns_per_game']:8.0f} ns/game, {r['bytes_per_record']:.0f} bytes/record\n")
+            if case == "scrape-capped" and r["items"] != games:
+                missing += 1
+                sys.stdout.write(f"MISSING GAMES {case} @ {games}: crawled {r['items']} of {games}\n")
+            sys.stdout.flush()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if not args.compare:
+        return 1 if missing else 0
+
+    with open(args.compare, "r", encoding="utf-8") as f:
+        baseline = {(r["case"], r["games"]): r for r in json.load(f)}
+    regressions = 0
+    for r in results:
+        base = baseline.get((r["case"], r["games"]))
+        if base is None:
+            continue
+        if base.get("config", config) != config:
+            sys.stdout.write(f"skipped {r['case']} @ {r['games']}: baseline ran with different settings\n")
+            continue
+        for metric in ("wall_s", "cpu_s", "peak_rss_mb", "bytes_per_record"):
+            if base.get(metric, 0) > 0 and metric in r and r[metric] > base[metric] * (1 + args.threshold):
+                regressions += 1
+                sys.stdout.write(
+                    f"REGRESSION {r['case']} @ {r['games']}: {metric} {base[metric]:.3f} -> {r[metric]:.3f} "
+                    f"(+{(r[metric] / base[metric] - 1) * 100:.0f}%)\n"
+                )
+    sys.stdout.write(f"{regressions} regression(s) against {args.compare}\n")
+    return 1 if regressions or missing else 0
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Local benchmarks for scrape_melbet_games.py")
+    sub = ap.add_subparsers(dest="bench", required=True)
+
+    launcher = sub.add_parser("launcher", help="load-test the launcher's catalog endpoints")
+    launcher.add_argument("--catalog", default="all_games.json")
+    launcher.add_argument("--servers", nargs="+", choices=["threading", "asyncio"], default=["threading", "asyncio"])
+    launcher.add_argument("--url", default=None, help="benchmark an already running launcher instead")
+    launcher.add_argument("--path", action="append", default=None, help="request path (repeatable; default: a mix of /api/games queries)")
+    launcher.add_argument("--requests", type=int, default=5000)
+    launcher.add_argument("--warmup", type=int, default=200)
+    launcher.add_argument("--concurrency", type=int, default=32)
+
+    fake = sub.add_parser("fake-api", help="serve a local stand-in for the MelBet catalog API")
+    fake.add_argument("--host", default="127.0.0.1")
+    fake.add_argument("--port", type=int, default=8765)
+    fake.add_argument("--games", type=int, default=10000)
+    fake.add_argument("--catalog", default=os.path.join(_HERE, "scraped_games.json"), help="scraped catalog the games are cycled from")
+    fake.add_argument("--replay", default=None, help="--cache SQLite file whose recorded responses are served verbatim")
+    fake.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    fake.add_argument("--error-rate", type=float, default=0.0, help="fraction of API requests answered with 503")
+    fake.add_argument("--max-limit", type=int, default=0, help="largest page the API returns, whatever limit is asked for (0: no cap)")
+    fake.add_argument("--rate-limit", type=float, default=0.0, help="API requests per second above which it answers 429 with Retry-After: 1")
+    fake.add_argument("--latency-per-game", type=float, default=0.0, help="seconds added per game in a games/1 response")
+    fake.add_argument("--seed", type=int, default=1)
+
+    scrape = sub.add_parser("scrape", help="time the crawler, parser, dedupe and writers")
+    scrape.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    scrape.add_argument("--cases", nargs="+", choices=_SCRAPE_CASES, default=_SCRAPE_CASES)
+    scrape.add_argument("--catalog", default=os.path.join(_HERE, "scraped_games.json"))
+    scrape.add_argument("--replay", default=None)
+    scrape.add_argument("--latency", type=float, default=0.0)
+    scrape.add_argument("--error-rate", type=float, default=0.0)
+    scrape.add_argument("--limit", type=int, default=100)
+    scrape.add_argument("--workers", type=int, default=4)
+    scrape.add_argument("--all-categories", action="store_true", help="crawl every category instead of the unfiltered list")
+    scrape.add_argument("--save", default=None, help="write the results as JSON")
+    scrape.add_argument("--compare", default=None, help="results JSON from an earlier --save to check for regressions")
+    scrape.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown/growth before a metric counts as a regression")
+
+    case = sub.add_parser("run-case")
+    case.add_argument("--case", choices=_SCRAPE_CASES, required=True)
+    case.add_argument("--games", type=int, required=True)
+    case.add_argument("--catalog", default=os.path.join(_HERE, "scraped_games.json"))
+    case.add_argument("--api-url", default="")
+    case.add_argument("--limit", type=int, default=100)
+    case.add_argument("--workers", type=int, default=4)
+    case.add_argument("--all-categories", action="store_true")
+
+    return ap.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = _parse_args(argv)
+    if args.bench == "launcher":
+        return _bench_launcher(args)
+    if args.bench == "fake-api":
+        return _serve_fake_api(args)
+    if args.bench == "scrape":
+        return _bench_scrape(args)
+    if args.bench == "run-case":
+        return _run_case(args)
+    return 2
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
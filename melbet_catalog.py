@@ -0,0 +1,121 @@
+"""Catalog-only entry point: list categories, scrape and export.
+
+A thin front end to scrape_melbet_games.py for cron jobs and other short
+runs. It never reaches the launcher or browser code, defaults to --mode
+http, and with --import-times reports where its startup went.
+"""
+import builtins
+import sys
+import time
+
+_T0 = time.perf_counter()
+
+
+class _ImportTimer:
+    """Times the first import of each module, `max_depth` import statements deep.
+
+    Installed over builtins.__import__ before anything else is imported, so
+    the records cover this script's own imports, the scraper module and what
+    the scraper imports lazily while the command runs.
+    """
+
+    def __init__(self, max_depth: int = 2):
+        self.max_depth = max_depth
+        self.records = []  # (depth, module, seconds), parents before children
+        self._depth = 0
+        self._import = builtins.__import__
+
+    def __call__(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules or self._depth >= self.max_depth:
+            return self._import(name, globals, locals, fromlist, level)
+        pos = len(self.records)
+        self.records.append(None)
+        self._depth += 1
+        t0 = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            self._depth -= 1
+            self.records[pos] = (self._depth, name, time.perf_counter() - t0)
+
+    def install(self) -> "_ImportTimer":
+        builtins.__import__ = self
+        return self
+
+    def report(self, started_s: float, command_s: float, startup_records: int) -> str:
+        """`startup_records` records were taken before the command started."""
+
+        def _total(records: list) -> float:
+            return sum(seconds for depth, _name, seconds in records if depth == 0) * 1000
+
+        lines = ["Import times (first import of each module, ms):"]
+        for i, (depth, name, seconds) in enumerate(self.records):
+            if i == startup_records:
+                lines.append("  -- imported while the command ran:")
+            lines.append(f"{seconds * 1000:9.1f}  {'  ' * depth}{name}")
+        lines.append(
+            f"Startup {started_s * 1000:.1f} ms, imports {_total(self.records[:startup_records]):.1f} ms of it; "
+            f"command {command_s * 1000:.1f} ms, lazy imports {_total(self.records[startup_records:]):.1f} ms of it\n"
+        )
+        return "\n".join(lines)
+
+
+# Decided before argparse is imported so it gets timed too; --import-times is
+# accepted after the command as well and _parse_args keeps it from the scraper.
+_TIMER = _ImportTimer().install() if "--import-times" in sys.argv[1:] else None
+
+import argparse  # noqa: E402
+from typing import List  # noqa: E402
+
+# Flags that start the launcher or a browser; they belong to scrape_melbet_games.py.
+_NOT_CATALOG = ("--serve", "--launch", "--test-extension", "--open-game")
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="List categories, scrape and export the MelBet game catalog",
+        epilog="Any other scrape_melbet_games.py option can follow the command, e.g. "
+        "'scrape --all-categories --max 0 --db catalog.sqlite' or "
+        "'export catalog.sqlite new.json --brand-id 323 --added-since 7'.",
+    )
+    ap.add_argument("--import-times", action="store_true", help="print the import time of every module on exit")
+    ap.add_argument("command", choices=["list", "scrape", "export"])
+    ap.add_argument("args", nargs=argparse.REMAINDER, help="scrape_melbet_games.py options (export: IN OUT first)")
+    args = ap.parse_args(argv)
+    args.args = [a for a in args.args if a != "--import-times"]
+    return args
+
+
+def _scraper_argv(args: argparse.Namespace) -> List[str]:
+    rest = list(args.args)
+    if args.command == "list":
+        rest = ["--list-categories"] + rest
+    elif args.command == "export":
+        if len(rest) < 2 or rest[0].startswith("-") or rest[1].startswith("-"):
+            raise SystemExit("export needs an input and an output catalog: export IN OUT [options]")
+        rest = ["--convert-catalog", rest[0], rest[1]] + rest[2:]
+    # Later options win, so an explicit --mode still applies.
+    return ["--mode", "http"] + rest
+
+
+def main(argv: List[str]) -> int:
+    args = _parse_args(argv)
+    bad = [a for a in args.args if a.split("=", 1)[0] in _NOT_CATALOG]
+    if bad:
+        sys.stderr.write(f"{' '.join(bad)}: not a catalog command, use scrape_melbet_games.py\n")
+        return 2
+    scraper_argv = _scraper_argv(args)
+
+    import scrape_melbet_games
+
+    started_s = time.perf_counter() - _T0
+    startup_records = len(_TIMER.records) if _TIMER is not None else 0
+    try:
+        return scrape_melbet_games.main(scraper_argv)
+    finally:
+        if _TIMER is not None:
+            sys.stderr.write(_TIMER.report(started_s, time.perf_counter() - _T0 - started_s, startup_records))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,33 +1,56 @@
 import argparse
-import asyncio
+import bisect
 import csv
+import hashlib
 import json
+import random
+import re
 import sys
 import time
-import webbrowser
 import html
-import http.server
-import socketserver
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, Iterable, List, Optional
+import http.client
+import http.cookiejar
+import io
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode, urlparse, parse_qs
-from urllib.request import build_opener, HTTPCookieProcessor, Request
-import http.cookiejar
 import threading
 import os
+import unicodedata
+
+if TYPE_CHECKING:
+    from urllib.request import Request
+
+# Heavy and optional modules (Playwright, brotli, asyncio, the launcher's
+# http.server, ...) are imported where they are used, so short invocations
+# such as --game-id or an http-mode --list-categories never load them.
+_OPTIONAL_MODULES: Dict[str, Any] = {}
+
+
+def _optional_module(name: str) -> Any:
+    """Imports an optional dependency on first use; None when it is missing or broken."""
+    if name not in _OPTIONAL_MODULES:
+        try:
+            __import__(name)
+            _OPTIONAL_MODULES[name] = sys.modules[name]
+        except Exception:
+            _OPTIONAL_MODULES[name] = None
+    return _OPTIONAL_MODULES[name]
+
 
-try:
-    from playwright.async_api import async_playwright  # type: ignore
+def _async_playwright() -> Any:
+    module = _optional_module("playwright.async_api")
+    return None if module is None else module.async_playwright
 
-    _HAS_PLAYWRIGHT = True
-except Exception:
-    async_playwright = None
-    _HAS_PLAYWRIGHT = False
 
+class Game(NamedTuple):
+    """One scraped game.
+
+    A named tuple rather than a dataclass: no per-instance dict, positional
+    construction in the parser, and writers serialize it field by field.
+    Use `_replace` for modified copies.
+    """
 
-@dataclass(frozen=True)
-class Game:
     id: int
     name: str
     brand_id: Optional[int]
@@ -42,6 +65,8 @@ class Game:
     img: Optional[str]
     img_url: Optional[str]
     game_url: Optional[str]
+    # lang -> localized name, filled by multi-locale crawls only.
+    names: Optional[Dict[str, str]] = None
 
 
 def _to_int(v: Any) -> Optional[int]:
@@ -63,36 +88,293 @@ def _cap_reached(current: int, max_games: int) -> bool:
     return max_games > 0 and current >= max_games
 
 
-def _make_http_opener(base_url: str, lang: str):
-    jar = http.cookiejar.CookieJar()
-    opener = build_opener(HTTPCookieProcessor(jar))
-    opener.addheaders = [
-        (
-            "User-Agent",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        ),
-        ("Accept", "application/json, text/plain, */*"),
-        ("Accept-Language", f"{lang},{lang};q=0.9,en;q=0.8"),
-        ("Referer", f"{base_url.rstrip('/')}/{lang}/slots"),
-        ("X-Requested-With", "XMLHttpRequest"),
-    ]
-
-    warm_url = f"{base_url.rstrip('/')}/{lang}/slots"
+_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+
+class _HttpResponse:
+    def __init__(self, url: str, status: int, headers: Any, body: bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    def read(self, amt: Optional[int] = None) -> bytes:
+        return self._body if amt is None else self._body[:amt]
+
+    def __enter__(self) -> "_HttpResponse":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+class _HttpSession:
+    """Thread-safe HTTP client shared by the scraper and the launcher.
+
+    One cookie jar and one pool of keep-alive connections per host, so the
+    `/slots` warm-up happens once per process and later requests skip the
+    TCP+TLS handshake. `open()` mirrors the subset of OpenerDirector.open that
+    this module uses (redirects followed, HTTPError for non-2xx, and the
+    HTTP(S)_PROXY / NO_PROXY environment honoured like ProxyHandler does).
+    """
+
+    def __init__(self, base_url: str, lang: str):
+        self.base_url = base_url.rstrip("/")
+        self.lang = lang
+        self.jar = http.cookiejar.CookieJar()
+        self.addheaders = [
+            ("User-Agent", _USER_AGENT),
+            ("Accept", "application/json, text/plain, */*"),
+            ("Accept-Language", f"{lang},{lang};q=0.9,en;q=0.8"),
+            ("Referer", f"{self.base_url}/{lang}/slots"),
+            ("X-Requested-With", "XMLHttpRequest"),
+        ]
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[Any]] = {}
+        self._warm_lock = threading.Lock()
+        self._warmed = False
+        self._proxies: Optional[Dict[str, str]] = None
+        self.requests = 0
+        self.handshakes = 0
+        self.reused = 0
+
+    def warm_up(self) -> None:
+        with self._warm_lock:
+            if self._warmed:
+                return
+            self._warmed = True
+            try:
+                with self.open(f"{self.base_url}/{self.lang}/slots", timeout=30) as r:
+                    r.read(1)
+            except Exception:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "handshakes": self.handshakes, "reused": self.reused}
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """(proxy host:port, proxy headers) for `scheme`, or None to connect directly."""
+        from urllib.request import getproxies, proxy_bypass
+
+        if self._proxies is None:
+            self._proxies = getproxies()
+        proxy = self._proxies.get(scheme)
+        if not proxy or proxy_bypass(host):
+            return None
+        parts = urlparse(proxy if "://" in proxy else f"http://{proxy}")
+        headers: Dict[str, str] = {}
+        if parts.username is not None:
+            import base64
+            from urllib.parse import unquote
+
+            userpass = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+            headers["Proxy-Authorization"] = "Basic " + base64.b64encode(userpass.encode()).decode("ascii")
+        return f"{parts.hostname}:{parts.port or (443 if parts.scheme == 'https' else 80)}", headers
+
+    def _checkout(self, scheme: str, netloc: str, timeout: float, proxy: Optional[Tuple[str, Dict[str, str]]] = None) -> Tuple[Any, bool]:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                self.reused += 1
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+            self.handshakes += 1
+        if scheme == "https":
+            if proxy is not None:
+                # TLS to the target through a CONNECT tunnel opened on the proxy.
+                conn = http.client.HTTPSConnection(proxy[0], timeout=timeout)
+                conn.set_tunnel(netloc, headers=proxy[1])
+                return conn, False
+            return http.client.HTTPSConnection(netloc, timeout=timeout), False
+        return http.client.HTTPConnection(proxy[0] if proxy is not None else netloc, timeout=timeout), False
+
+    def _checkin(self, scheme: str, netloc: str, conn: Any) -> None:
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def _send(self, req: "Request", timeout: float) -> _HttpResponse:
+        parts = urlparse(req.full_url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {k.title(): v for k, v in req.header_items()}
+        # Pooled per (scheme, netloc) as before: a plain-http proxy gets the
+        # absolute URL and is keyed by its own address, a tunnel by the target.
+        proxy = self._proxy_for(parts.scheme, parts.hostname or "")
+        pool_netloc = parts.netloc
+        if proxy is not None and parts.scheme == "http":
+            path = req.full_url
+            pool_netloc = proxy[0]
+            headers.update(proxy[1])
+        for k, v in self.addheaders:
+            headers.setdefault(k, v)
+        headers.setdefault("Accept-Encoding", "gzip")
+        self.jar.add_cookie_header(req)
+        cookie = req.get_header("Cookie") or req.unredirected_hdrs.get("Cookie")
+        if cookie:
+            headers["Cookie"] = cookie
+
+        for attempt in (0, 1):
+            conn, reused = self._checkout(parts.scheme, pool_netloc, timeout, proxy)
+            with self._lock:
+                self.requests += 1
+            try:
+                conn.request(req.get_method(), path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0:
+                    # The server dropped an idle keep-alive connection; retry on a fresh one.
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(parts.scheme, pool_netloc, conn)
+            break
+
+        self.jar.extract_cookies(resp, req)
+        if (resp.getheader("Content-Encoding") or "").lower() == "gzip":
+            import gzip
+
+            body = gzip.decompress(body)
+        return _HttpResponse(req.full_url, resp.status, resp.msg, body)
+
+    def open(self, req: Any, timeout: float = 30) -> _HttpResponse:
+        from urllib.request import Request
+
+        if isinstance(req, str):
+            req = Request(req, method="GET")
+        for _ in range(10):
+            resp = self._send(req, timeout)
+            location = resp.headers.get("Location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                from urllib.parse import urljoin
+
+                # Cookie and Host belong to the old URL; _send rebuilds them for the new one.
+                headers = {k: v for k, v in req.headers.items() if k.lower() not in ("cookie", "host")}
+                req = Request(urljoin(req.full_url, location), method="GET", headers=headers)
+                continue
+            if not 200 <= resp.status < 300:
+                raise HTTPError(resp.url, resp.status, str(resp.status), resp.headers, io.BytesIO(resp.read()))
+            return resp
+        raise URLError(f"too many redirects, last to {req.full_url}")
+
+
+_HTTP_SESSIONS: Dict[Tuple[str, str], _HttpSession] = {}
+_HTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_http_session(base_url: str, lang: str, warm_up: bool = True) -> _HttpSession:
+    key = (base_url.rstrip("/"), lang)
+    with _HTTP_SESSIONS_LOCK:
+        session = _HTTP_SESSIONS.get(key)
+        if session is None:
+            session = _HTTP_SESSIONS[key] = _HttpSession(base_url, lang)
+    if warm_up:
+        session.warm_up()
+    return session
+
+
+def _http_stats() -> Dict[str, int]:
+    totals = {"requests": 0, "handshakes": 0, "reused": 0}
+    with _HTTP_SESSIONS_LOCK:
+        sessions = list(_HTTP_SESSIONS.values())
+    for session in sessions:
+        for k, v in session.stats().items():
+            totals[k] += v
+    return totals
+
+
+def _http_get(session, url: str, timeout_s: float, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, bytes]:
+    from urllib.request import Request
+
+    req = Request(url, method="GET", headers=headers or {})
     try:
-        with opener.open(warm_url, timeout=30) as r:
-            r.read(1)
-    except Exception:
-        pass
-    return opener
+        with session.open(req, timeout=timeout_s) as r:
+            return r.status, r.headers, r.read()
+    except HTTPError as e:
+        if e.code == 304:
+            return 304, e.headers, b""
+        raise
 
 
-def _http_get_text(opener, url: str, timeout_s: float) -> str:
-    req = Request(url, method="GET")
-    with opener.open(req, timeout=timeout_s) as r:
-        data = r.read()
+def _http_get_text(session, url: str, timeout_s: float) -> str:
+    _status, _headers, data = _http_get(session, url, timeout_s)
     return data.decode("utf-8", errors="replace")
 
 
+class _CachedResponse:
+    def __init__(self, body: bytes, etag: Optional[str], last_modified: Optional[str], fetched_at: float):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at
+
+
+class _HttpCache:
+    """On-disk JSON response cache in a single SQLite file.
+
+    Entries younger than `ttl_s` are served without touching the network;
+    older ones are revalidated with If-None-Match / If-Modified-Since when the
+    server sent validators. With `offline` set every cached entry is served
+    regardless of age and a miss is an error.
+    """
+
+    def __init__(self, path: str, ttl_s: float, offline: bool = False):
+        import sqlite3
+
+        self.path = path
+        self.ttl_s = float(ttl_s)
+        self.offline = offline
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, fetched_at REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def key_for(session, url: str) -> str:
+        # Responses are localised through Accept-Language, not the URL.
+        lang = next((v for k, v in getattr(session, "addheaders", []) if k == "Accept-Language"), "")
+        return f"{url} lang={lang}"
+
+    def get(self, key: str) -> Optional[_CachedResponse]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        return _CachedResponse(row[0], row[1], row[2], row[3]) if row else None
+
+    def is_fresh(self, entry: _CachedResponse) -> bool:
+        return self.offline or (time.time() - entry.fetched_at) < self.ttl_s
+
+    def put(self, key: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, time.time()),
+            )
+
+    def touch(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
 def _get_demo_link_http(
     base_url: str,
     lang: str,
@@ -101,14 +383,7 @@ def _get_demo_link_http(
     backoff_s: float,
 ) -> str:
     base_url = base_url.rstrip("/")
-    opener = _make_http_opener(base_url, lang)
-
-    warm_url = f"{base_url}/{lang}/slots?game={int(game_id)}"
-    try:
-        with opener.open(warm_url, timeout=30) as r:
-            r.read(1)
-    except Exception:
-        pass
+    session = _get_http_session(base_url, lang)
 
     api_url = _build_api_url(
         base_url,
@@ -121,12 +396,652 @@ def _get_demo_link_http(
             "launchDomain": "melbet-tn.com/",
         },
     )
-    j = _http_get_json_with_retries(opener, api_url, retries=retries, backoff_s=backoff_s)
+    try:
+        j = _http_get_json_with_retries(session, api_url, retries=0, backoff_s=backoff_s)
+    except RuntimeError:
+        j = None
+    if not isinstance(j, dict) or not isinstance(j.get("link"), str) or not j.get("link"):
+        # Fall back to the old flow: open the game page first so the site can
+        # set whatever per-game state it needs, then retry the API.
+        warm_url = f"{base_url}/{lang}/slots?game={int(game_id)}"
+        try:
+            with session.open(warm_url, timeout=30) as r:
+                r.read(1)
+        except Exception:
+            pass
+        j = _http_get_json_with_retries(session, api_url, retries=retries, backoff_s=backoff_s)
     if not isinstance(j, dict) or not isinstance(j.get("link"), str) or not j.get("link"):
         raise RuntimeError("Demo link not found in response")
     return str(j["link"])
 
 
+# Game fields the launcher keeps next to id and name, and the /api/games
+# facet parameters filtering on them.
+_LAUNCHER_FIELDS = ("brand_id", "brand_name", "provider_id", "categories", "has_demo", "is_new", "is_promo", "is_hot", "img_url")
+_FACETS = {
+    "brand": "brand_id",
+    "category": "categories",
+    "provider": "provider_id",
+    "has_demo": "has_demo",
+    "is_new": "is_new",
+    "is_promo": "is_promo",
+    "is_hot": "is_hot",
+}
+
+
+def _launcher_row(gid: int, g: Dict[str, Any]) -> Dict[str, Any]:
+    name = g.get("name")
+    row: Dict[str, Any] = {"id": gid, "name": str(name) if name is not None else ""}
+    for field in _LAUNCHER_FIELDS:
+        row[field] = g.get(field)
+    return row
+
+
+def _facet_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, str) and value.lower() in ("true", "yes", "false", "no"):
+        return int(value.lower() in ("true", "yes"))
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def _popcount(bits: int) -> int:
+    return bin(bits).count("1")
+
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count  # noqa: F811
+
+
+class _CatalogRows(Sequence):
+    """The launcher's game rows served straight off a melcat catalog."""
+
+    def __init__(self, catalog: "_ColumnarCatalog"):
+        self.catalog = catalog
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return _launcher_row(self.catalog.ids[i], self.catalog.game(i)._asdict())
+
+
+def _fold(text: str) -> str:
+    """Search form of a name: no accents, symbols or punctuation, casefolded."""
+    text = "".join(ch for ch in text if unicodedata.category(ch) != "So")
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in text).split())
+
+
+class _GameIndex:
+    """In-memory search index over the launcher's game rows.
+
+    Substring matches go through trigram postings (then a check against the
+    folded name), word matches through a sorted token vocabulary, so a query
+    touches only its candidates. Results are ranked and paged by a keyset
+    cursor: "<rank>.<row>" of the last item returned.
+
+    Every facet value (brand, category, provider, flag) has a bitmap of its
+    rows as one Python int, bit i for row i. Filters OR the bitmaps of the
+    values given for a facet and AND across facets; facet counts are
+    popcounts of a value's bitmap against the current result set.
+    """
+
+    _RANK_ID, _RANK_EXACT, _RANK_PREFIX, _RANK_WORD, _RANK_TOKENS, _RANK_SUBSTRING = range(6)
+
+    def __init__(self, rows: Sequence[Dict[str, Any]], cache_size: int = 256):
+        self.rows = rows
+        self.source: Optional[str] = None
+        # Identifies the catalog file contents; part of the launcher's ETags.
+        self.version = "0"
+        self.ids: List[int] = []
+        self.folded: List[str] = []
+        self._by_id: Dict[int, int] = {}
+        grams: Dict[str, List[int]] = {}
+        tokens: Dict[str, List[int]] = {}
+        facets: Dict[str, Dict[Any, bytearray]] = {param: {} for param in _FACETS}
+        self.brand_names: Dict[Any, str] = {}
+        nbytes = (len(rows) + 7) // 8
+        for i, row in enumerate(rows):
+            gid = int(row["id"])
+            for param, field in _FACETS.items():
+                values = row.get(field)
+                for value in values if isinstance(values, list) else [values]:
+                    if value is None:
+                        continue
+                    value = _facet_value(value)
+                    bits = facets[param].get(value)
+                    if bits is None:
+                        bits = facets[param][value] = bytearray(nbytes)
+                    bits[i >> 3] |= 1 << (i & 7)
+            if row.get("brand_id") is not None and row.get("brand_name"):
+                self.brand_names.setdefault(_facet_value(row["brand_id"]), str(row["brand_name"]))
+            name = _fold(str(row.get("name") or ""))
+            self.ids.append(gid)
+            self.folded.append(name)
+            self._by_id.setdefault(gid, i)
+            # "|" never survives _fold, so no query gram can span name and id.
+            text = f" {name} | {gid} "
+            for gram in {text[j : j + 3] for j in range(len(text) - 2)}:
+                grams.setdefault(gram, []).append(i)
+            for tok in set(name.split()):
+                tokens.setdefault(tok, []).append(i)
+        self._grams = grams
+        self._tokens = tokens
+        self._facets = {
+            param: {value: int.from_bytes(bits, "little") for value, bits in postings.items()}
+            for param, postings in facets.items()
+        }
+        self._all = (1 << len(rows)) - 1
+        self._vocab = sorted(tokens)
+        self._gram_vocab = sorted(grams)
+        self._results: Dict[Any, Any] = {}
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._lookup("", {})
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def row_for(self, game_id: int) -> Optional[Dict[str, Any]]:
+        i = self._by_id.get(game_id)
+        return None if i is None else self.rows[i]
+
+    def _substring(self, q: str) -> List[int]:
+        if len(q) < 3:
+            # Every substring of a name or id up to three characters sits
+            # inside one of its (space padded) trigrams.
+            hit = set()
+            for gram in self._gram_vocab:
+                if q in gram:
+                    hit.update(self._grams[gram])
+            return list(hit)
+        postings = []
+        for j in range(len(q) - 2):
+            p = self._grams.get(q[j : j + 3])
+            if p is None:
+                return []
+            postings.append(p)
+        postings.sort(key=len)
+        hit = set(postings[0])
+        for p in postings[1:]:
+            hit.intersection_update(p)
+            if not hit:
+                return []
+        return [i for i in hit if q in self.folded[i] or q in str(self.ids[i])]
+
+    def _prefixed(self, prefix: str) -> set:
+        out = set()
+        k = bisect.bisect_left(self._vocab, prefix)
+        while k < len(self._vocab) and self._vocab[k].startswith(prefix):
+            out.update(self._tokens[self._vocab[k]])
+            k += 1
+        return out
+
+    def _all_tokens(self, q: str) -> set:
+        words = sorted(set(q.split()), key=len, reverse=True)
+        hit = self._prefixed(words[0])
+        for w in words[1:]:
+            if not hit:
+                break
+            hit &= self._prefixed(w)
+        return hit
+
+    def _rank(self, i: int, q: str) -> int:
+        name = self.folded[i]
+        if q == str(self.ids[i]):
+            return self._RANK_ID
+        if name == q:
+            return self._RANK_EXACT
+        if name.startswith(q):
+            return self._RANK_PREFIX
+        if f" {q}" in name:
+            return self._RANK_WORD
+        if q in name or q in str(self.ids[i]):
+            return self._RANK_SUBSTRING
+        return self._RANK_TOKENS
+
+    def _search(self, q: str) -> List[Tuple[int, int]]:
+        if not q:
+            return [(0, i) for i in range(len(self.ids))]
+        hit = set(self._substring(q))
+        hit.update(self._all_tokens(q))
+        return sorted((self._rank(i, q), i) for i in hit)
+
+    def _filter_mask(self, filters: Dict[str, List[str]], skip: Optional[str] = None) -> int:
+        mask = self._all
+        for param, values in filters.items():
+            if param == skip or param not in self._facets:
+                continue
+            postings = self._facets[param]
+            any_of = 0
+            for value in values:
+                any_of |= postings.get(_facet_value(value), 0)
+            mask &= any_of
+        return mask
+
+    def _memo(self, key: Any, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._results:
+                value = self._results[key] = self._results.pop(key)
+                return value
+        value = compute()
+        with self._lock:
+            self._results[key] = value
+            while len(self._results) > self._cache_size:
+                self._results.pop(next(iter(self._results)))
+        return value
+
+    def _filters_key(self, filters: Dict[str, List[str]]) -> Tuple[Any, ...]:
+        return tuple(sorted((p, tuple(sorted(set(v)))) for p, v in filters.items() if p in self._facets and v))
+
+    def _lookup(self, q: str, filters: Dict[str, List[str]]) -> Tuple[List[Tuple[int, int]], int]:
+        """Cached (sorted (rank, row) keys, row bitmap) for a folded query."""
+        fkey = self._filters_key(filters)
+
+        def _compute() -> Tuple[List[Tuple[int, int]], int]:
+            if fkey:
+                keys, mask = self._lookup(q, {}) if q else ([], self._all)
+                mask &= self._filter_mask(filters)
+                member = mask.to_bytes((len(self.ids) + 7) // 8, "little")
+                if q:
+                    keys = [k for k in keys if member[k[1] >> 3] >> (k[1] & 7) & 1]
+                else:
+                    keys = [(0, j << 3 | b) for j, byte in enumerate(member) if byte for b in range(8) if byte >> b & 1]
+                return keys, mask
+            if not q:
+                return self._search(q), self._all
+            keys = self._search(q)
+            bits = bytearray((len(self.ids) + 7) // 8)
+            for _, i in keys:
+                bits[i >> 3] |= 1 << (i & 7)
+            return keys, int.from_bytes(bits, "little")
+
+        return self._memo(("rows", q, fkey), _compute)
+
+    def search(self, query: str, filters: Optional[Dict[str, List[str]]] = None) -> List[Tuple[int, int]]:
+        """All matches of `query` as sorted (rank, row) keys."""
+        return self._lookup(_fold(query), filters or {})[0]
+
+    def page(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, List[str]]] = None,
+    ) -> Tuple[int, List[Dict[str, Any]], Optional[str]]:
+        """(total, rows, next_cursor) for one page; `cursor` wins over `offset`."""
+        keys = self.search(query, filters)
+        start = offset
+        if cursor:
+            try:
+                rank, _, row = cursor.partition(".")
+                start = bisect.bisect_right(keys, (int(rank), int(row)))
+            except ValueError:
+                start = offset
+        chunk = keys[start : start + limit]
+        next_cursor = None
+        if chunk and start + limit < len(keys):
+            next_cursor = "%d.%d" % chunk[-1]
+        return len(keys), [self.rows[i] for _, i in chunk], next_cursor
+
+    def facet_counts(self, query: str, filters: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Non-zero counts per facet value, each facet ignoring its own filter."""
+        filters = filters or {}
+        q = _fold(query)
+
+        def _compute() -> Dict[str, List[Dict[str, Any]]]:
+            matched = self._lookup(q, {})[1] if q else self._all
+            out: Dict[str, List[Dict[str, Any]]] = {}
+            for param, postings in self._facets.items():
+                base = matched & self._filter_mask(filters, skip=param)
+                counts = [(value, _popcount(bits & base)) for value, bits in postings.items()]
+                counts.sort(key=lambda vc: (-vc[1], str(vc[0])))
+                items = []
+                for value, count in counts:
+                    if not count:
+                        break
+                    item: Dict[str, Any] = {"value": value, "count": count}
+                    if param == "brand" and value in self.brand_names:
+                        item["name"] = self.brand_names[value]
+                    items.append(item)
+                out[param] = items
+            return out
+
+        return self._memo(("facets", q, self._filters_key(filters)), _compute)
+
+
+class _DemoLinkStore:
+    """Persistent game id -> demo URL map with per-entry expiry (a JSON file)."""
+
+    def __init__(self, path: Optional[str], ttl_s: float):
+        self.path = path
+        self.ttl_s = float(ttl_s)
+        self._lock = threading.Lock()
+        # Launcher threads save concurrently; one writer at a time owns the tmp file.
+        self._save_lock = threading.Lock()
+        self._links: Dict[int, Dict[str, Any]] = {}
+        if path:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (FileNotFoundError, ValueError):
+                data = {}
+            if isinstance(data, dict):
+                for k, v in data.items():
+                    gid = _to_int(k)
+                    if gid is not None and isinstance(v, dict) and isinstance(v.get("url"), str):
+                        self._links[gid] = {"url": v["url"], "resolved_at": float(v.get("resolved_at") or 0)}
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def get(self, game_id: int) -> Optional[str]:
+        with self._lock:
+            entry = self._links.get(int(game_id))
+        if entry is None or time.time() - entry["resolved_at"] >= self.ttl_s:
+            return None
+        return entry["url"]
+
+    def put(self, game_id: int, url: str) -> None:
+        with self._lock:
+            self._links[int(game_id)] = {"url": url, "resolved_at": time.time()}
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._save_lock:
+            with self._lock:
+                payload = {str(k): v for k, v in sorted(self._links.items())}
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+
+
+def resolve_demo_links(
+    base_url: str,
+    lang: str,
+    games: List[Game],
+    store: _DemoLinkStore,
+    retries: int,
+    backoff_s: float,
+    workers: int = 4,
+    sleep_s: float = 0.2,
+) -> Dict[str, int]:
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    todo = [g.id for g in games if g.has_demo and store.get(g.id) is None]
+    counts = {"resolved": 0, "failed": 0, "skipped": len([g for g in games if g.has_demo]) - len(todo)}
+    limiter = _RateLimiter(sleep_s)
+
+    def _resolve(game_id: int) -> str:
+        limiter.wait()
+        return _get_demo_link_http(base_url=base_url, lang=lang, game_id=game_id, retries=retries, backoff_s=backoff_s)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {pool.submit(_resolve, gid): gid for gid in todo}
+        for n, fut in enumerate(as_completed(futures), start=1):
+            try:
+                store.put(futures[fut], fut.result())
+                counts["resolved"] += 1
+            except Exception as e:
+                counts["failed"] += 1
+                sys.stderr.write(f"game {futures[fut]}: {e}\n")
+            if n % 50 == 0:
+                store.save()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        store.save()
+    return counts
+
+
+class _ImageStore:
+    """Content-addressed thumbnail cache.
+
+    Images live under <root>/objects/<aa>/<sha256><ext>, so games sharing an
+    image (or two URLs serving the same bytes) share one file, and
+    <root>/manifest.json maps each game id to its source URL and object.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+        self.refresh()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self) -> None:
+        """Re-reads the manifest if another process (a mirror run) rewrote it."""
+        try:
+            st = os.stat(self.manifest_path)
+        except OSError:
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        entries: Dict[int, Dict[str, Any]] = {}
+        if isinstance(data, dict):
+            for k, v in data.items():
+                gid = _to_int(k)
+                if gid is not None and isinstance(v, dict) and isinstance(v.get("object"), str):
+                    entries[gid] = v
+        with self._lock:
+            self._entries, self._stamp = entries, stamp
+
+    def get(self, game_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._entries.get(int(game_id))
+
+    def object_path(self, name: str) -> str:
+        return os.path.join(self.root, "objects", *name.split("/"))
+
+    def has(self, game_id: int, url: str) -> bool:
+        entry = self.get(game_id)
+        return entry is not None and entry.get("url") == url and os.path.exists(self.object_path(entry["object"]))
+
+    def put(self, game_id: int, url: str, data: bytes, content_type: Optional[str]) -> Dict[str, Any]:
+        digest = hashlib.sha256(data).hexdigest()
+        ext = os.path.splitext(urlparse(url).path)[1].lower()
+        if not ext or len(ext) > 6:
+            import mimetypes
+
+            ext = mimetypes.guess_extension((content_type or "").split(";")[0].strip()) or ""
+        name = f"{digest[:2]}/{digest}{ext}"
+        path = self.object_path(name)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        entry = {
+            "url": url,
+            "object": name,
+            "sha256": digest,
+            "content_type": (content_type or "application/octet-stream").split(";")[0].strip(),
+            "bytes": len(data),
+            "fetched_at": time.time(),
+        }
+        with self._lock:
+            self._entries[int(game_id)] = entry
+        return entry
+
+    def save(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        with self._lock:
+            payload = {str(k): v for k, v in sorted(self._entries.items())}
+        tmp = f"{self.manifest_path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+
+def mirror_images(
+    base_url: str,
+    lang: str,
+    games: List[Game],
+    store: _ImageStore,
+    retries: int,
+    backoff_s: float,
+    workers: int = 4,
+    sleep_s: float = 0.2,
+) -> Dict[str, int]:
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # One download per distinct URL; every game using it gets the entry.
+    by_url: Dict[str, List[int]] = {}
+    skipped = 0
+    for g in games:
+        if not g.img_url:
+            continue
+        if store.has(g.id, g.img_url):
+            skipped += 1
+            continue
+        by_url.setdefault(g.img_url, []).append(g.id)
+    counts = {"downloaded": 0, "failed": 0, "skipped": skipped, "bytes": 0}
+    session = _get_http_session(base_url, lang, warm_up=False)
+    limiter = _RateLimiter(sleep_s)
+
+    def _fetch(url: str) -> Tuple[bytes, Optional[str]]:
+        last_err: Optional[str] = None
+        for attempt in range(retries + 1):
+            limiter.wait()
+            try:
+                _status, headers, data = _http_get(session, url, timeout_s=30)
+                if data:
+                    return data, headers.get("Content-Type")
+                last_err = "empty body"
+            except Exception as e:
+                last_err = str(e)
+            if attempt < retries:
+                time.sleep(_backoff_delay(backoff_s, attempt))
+        raise RuntimeError(last_err or "download failed")
+
+    pool = ThreadPoolExecutor(max_workers=max(1, workers))
+    try:
+        futures = {pool.submit(_fetch, url): url for url in by_url}
+        for n, fut in enumerate(as_completed(futures), start=1):
+            url = futures[fut]
+            try:
+                data, content_type = fut.result()
+                for gid in by_url[url]:
+                    store.put(gid, url, data, content_type)
+                counts["downloaded"] += 1
+                counts["bytes"] += len(data)
+            except Exception as e:
+                counts["failed"] += 1
+                sys.stderr.write(f"{url}: {e}\n")
+            if n % 50 == 0:
+                store.save()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        store.save()
+    return counts
+
+
+_JSON_TYPE = "application/json; charset=utf-8"
+_HTML_TYPE = "text/html; charset=utf-8"
+_IMAGE_OBJECT_NAME = re.compile(r"^[0-9a-f]{2}/[0-9a-f]{64}(\.[a-z0-9]{1,5})?$")
+
+
+def _http_response(status: int, headers: Dict[str, str], body: bytes, keep_alive: bool) -> bytes:
+    lines = [f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}"]
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    if status != 304:
+        lines.append(f"Content-Length: {len(body)}")
+    lines.append(f"Connection: {'keep-alive' if keep_alive else 'close'}")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+# Smallest body worth compressing; below this the headers dominate anyway.
+_COMPRESS_MIN_BYTES = 512
+
+
+def _negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """"br", "gzip" or None (identity) for an Accept-Encoding header."""
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name.strip():
+            qualities[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in (["br"] if _optional_module("brotli") is not None else []) + ["gzip"]:
+        q = qualities.get(encoding, qualities.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def _encode_body(body: bytes, encoding: Optional[str]) -> bytes:
+    if encoding == "br":
+        return _optional_module("brotli").compress(body, quality=5)
+    if encoding == "gzip":
+        import gzip
+
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+
+class _BodyCache:
+    """LRU of finished response bodies keyed by (ETag, accepted encoding).
+
+    Values are (Content-Encoding or None, body): small bodies are stored
+    as-is even when the client accepts compression.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._bodies: Dict[Tuple[str, Optional[str]], Tuple[Optional[str], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, Optional[str]]) -> Optional[Tuple[Optional[str], bytes]]:
+        with self._lock:
+            body = self._bodies.pop(key, None)
+            if body is not None:
+                self._bodies[key] = body
+            return body
+
+    def put(self, key: Tuple[str, Optional[str]], body: Tuple[Optional[str], bytes]) -> None:
+        with self._lock:
+            self._bodies[key] = body
+            while len(self._bodies) > self.max_entries:
+                self._bodies.pop(next(iter(self._bodies)))
+
+
 def serve_launcher(
     base_url: str,
     lang: str,
@@ -135,11 +1050,16 @@ def serve_launcher(
     retries: int,
     backoff_s: float,
     initial_balance: float = 1000.0,
+    demo_store: Optional[_DemoLinkStore] = None,
+    catalog_path: Optional[str] = None,
+    reload_interval_s: float = 2.0,
+    server: str = "threading",
+    max_concurrency: int = 64,
+    image_store: Optional[_ImageStore] = None,
 ) -> None:
-    cache: Dict[int, str] = {}
-    games_cache: Optional[List[Dict[str, Any]]] = None
-    games_cache: Optional[List[Dict[str, Any]]] = None
-    games_source: Optional[str] = None
+    cache = demo_store if demo_store is not None else _DemoLinkStore(None, ttl_s=float("inf"))
+    games_cache: Optional[_GameIndex] = None
+    games_stamp: Optional[Tuple[int, int, int]] = None
 
     class Wallet:
         def __init__(self, initial_balance: float = 1000.0):
@@ -150,73 +1070,403 @@ def serve_launcher(
 
     wallet = Wallet(initial_balance=initial_balance)
 
-    def _load_games_index() -> List[Dict[str, Any]]:
-        nonlocal games_cache, games_source
-        if games_cache is not None:
-            return games_cache
-
-        candidates = [
+    def _catalog_candidates() -> List[str]:
+        return [catalog_path] if catalog_path else [
+            "all_games.melcat",
+            "all_games.sqlite",
             "all_games.json",
             "all_games_enriched.json",
             "sample_all_categories2.json",
             "sample_all_categories.json",
             "sample_games.json",
         ]
-        for path in candidates:
+
+    def _catalog_stamp(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _build_games_index(path: str, stamp: Optional[Tuple[int, int, int]]) -> Optional[_GameIndex]:
+        version = "%x.%x.%x" % stamp if stamp else "0"
+        if path.endswith(".melcat"):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except FileNotFoundError:
+                index = _GameIndex(_CatalogRows(_ColumnarCatalog(path)))
+            except Exception:
+                return None
+            index.source, index.version = path, version
+            return index
+        if _is_catalog_db(path):
+            try:
+                index = _GameIndex(_DbRows(_CatalogDb(path, readonly=True)))
+            except Exception:
+                return None
+            index.source, index.version = path, version
+            return index
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            return None
+
+        if not isinstance(data, list):
+            return None
+
+        out: List[Dict[str, Any]] = []
+        for g in data:
+            if not isinstance(g, dict):
+                continue
+            if "id" not in g:
                 continue
+            try:
+                gid = int(g.get("id"))
             except Exception:
                 continue
 
-            if not isinstance(data, list):
-                continue
+            out.append(_launcher_row(gid, g))
 
-            out: List[Dict[str, Any]] = []
-            for g in data:
-                if not isinstance(g, dict):
-                    continue
-                if "id" not in g:
+        index = _GameIndex(out)
+        index.source, index.version = path, version
+        return index
+
+    def _load_games_index() -> _GameIndex:
+        nonlocal games_cache, games_stamp
+        if games_cache is not None:
+            return games_cache
+
+        for path in _catalog_candidates():
+            stamp = _catalog_stamp(path)
+            index = _build_games_index(path, stamp)
+            if index is not None:
+                games_cache, games_stamp = index, stamp
+                return index
+
+        games_cache = _GameIndex([])
+        return games_cache
+
+    def _watch_catalog(interval_s: float) -> None:
+        # Requests take one reference to games_cache and keep using it, so a
+        # rebuilt index is swapped in with a single assignment and the old one
+        # lives on until its last request finishes.
+        nonlocal games_cache, games_stamp
+        while True:
+            time.sleep(interval_s)
+            current = _load_games_index()
+            for path in _catalog_candidates():
+                stamp = _catalog_stamp(path)
+                if stamp is None:
                     continue
-                try:
-                    gid = int(g.get("id"))
-                except Exception:
+                if path == current.source and stamp == games_stamp:
+                    break
+                t0 = time.time()
+                index = _build_games_index(path, stamp)
+                if index is None:
+                    # Half-written or broken: keep serving what we have and
+                    # look again on the next poll.
+                    if path == current.source:
+                        break
                     continue
+                if _catalog_stamp(path) != stamp:
+                    break
+                games_cache, games_stamp = index, stamp
+                sys.stdout.write(f"Reloaded {len(index)} games from {path} in {time.time() - t0:.2f}s\n")
+                break
+
+    def _facet_filters(qs: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        filters: Dict[str, List[str]] = {}
+        for param in _FACETS:
+            values = [v.strip() for raw in qs.get(param) or [] for v in raw.split(",") if v.strip()]
+            if values:
+                filters[param] = values
+        return filters
+
+    def _api_games(index: _GameIndex, qs: Dict[str, List[str]]) -> Dict[str, Any]:
+        q_raw = ((qs.get("q") or [""])[0] or "").strip()
+        try:
+            limit = int((qs.get("limit") or ["50"])[0])
+        except Exception:
+            limit = 50
+        try:
+            offset = int((qs.get("offset") or ["0"])[0])
+        except Exception:
+            offset = 0
 
-                name = g.get("name")
-                out.append(
-                    {
-                        "id": gid,
-                        "name": str(name) if name is not None else "",
-                    }
-                )
+        limit = max(1, min(200, limit))
+        offset = max(0, offset)
+
+        cursor = (qs.get("cursor") or [None])[0]
+        filters = _facet_filters(qs)
+        total, page, next_cursor = index.page(q_raw, limit, offset=offset, cursor=cursor, filters=filters)
+        return {
+            "source": index.source,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "items": page,
+            "next_cursor": next_cursor,
+            "filters": filters,
+            "facets": index.facet_counts(q_raw, filters),
+        }
 
-            games_cache = out
-            games_source = path
-            return out
+    def _games_page(index: _GameIndex, qs: Dict[str, List[str]]) -> str:
+        q_raw = ((qs.get("q") or [""])[0] or "").strip()
+        try:
+            limit = int((qs.get("limit") or ["50"])[0])
+        except Exception:
+            limit = 50
+        try:
+            offset = int((qs.get("offset") or ["0"])[0])
+        except Exception:
+            offset = 0
 
-        games_cache = []
-        games_source = None
-        return games_cache
+        limit = max(1, min(200, limit))
+        offset = max(0, offset)
+
+        filters = _facet_filters(qs)
+        total, page, _ = index.page(q_raw, limit, offset=offset, filters=filters)
+
+        def _make_link(new_offset: int) -> str:
+            params: Dict[str, Any] = {"limit": limit, "offset": new_offset}
+            if q_raw:
+                params["q"] = q_raw
+            params.update({p: ",".join(v) for p, v in filters.items()})
+            return "/games?" + urlencode(params)
+
+        prev_link = _make_link(max(0, offset - limit)) if offset > 0 else ""
+        next_link = _make_link(offset + limit) if (offset + limit) < total else ""
+
+        rows = "\n".join(
+            (
+                "<tr>"
+                f"<td><img src=\"/img/{int(g.get('id'))}\" loading=\"lazy\" width=\"64\" height=\"48\" alt=\"\" /></td>"
+                f"<td><code>{int(g.get('id'))}</code></td>"
+                f"<td>{html.escape(str(g.get('name') or ''))}</td>"
+                f"<td><a href=\"/game/{int(g.get('id'))}\">Launch</a></td>"
+                "</tr>"
+            )
+            for g in page
+        )
+
+        filter_inputs = "".join(
+            f'<input type="hidden" name="{p}" value="{html.escape(",".join(v))}" />' for p, v in filters.items()
+        )
+        api_link = html.escape(_make_link(offset).replace("/games?", "/api/games?", 1))
+        src = html.escape(index.source or "(none)")
+        return f"""<!doctype html>
+<html>
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <title>Games</title>
+    <style>
+      body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, sans-serif; margin: 24px; }}
+      a {{ color: #2563eb; text-decoration: none; }}
+      .top {{ display:flex; gap: 12px; align-items: center; flex-wrap: wrap; }}
+      input {{ padding: 10px; font-size: 16px; width: 280px; }}
+      button {{ padding: 10px 14px; font-size: 16px; }}
+      table {{ width: 100%; border-collapse: collapse; margin-top: 16px; }}
+      th, td {{ padding: 10px; border-bottom: 1px solid #eee; text-align: left; }}
+      code {{ background: #f3f4f6; padding: 2px 6px; border-radius: 6px; }}
+      td img {{ display: block; object-fit: cover; border-radius: 4px; background: #f3f4f6; }}
+      .muted {{ color: #666; }}
+      .pager {{ margin-top: 14px; display:flex; gap: 12px; align-items:center; }}
+    </style>
+  </head>
+  <body>
+    <div class=\"top\">
+      <h1 style=\"margin:0\">Games</h1>
+      <a href=\"/\">Home</a>
+      <span class=\"muted\">source: <code>{src}</code></span>
+    </div>
+    <form action=\"/games\" method=\"get\" style=\"margin-top:12px\">
+      <input name=\"q\" value=\"{html.escape(q_raw)}\" placeholder=\"search by id or name\" />
+      <input type=\"hidden\" name=\"limit\" value=\"{limit}\" />
+      {filter_inputs}
+      <button type=\"submit\">Search</button>
+      <a href=\"/games\" style=\"margin-left:10px\">Clear</a>
+    </form>
+    <div class=\"muted\" style=\"margin-top:8px\">showing {offset + 1 if total else 0}-{min(offset + limit, total)} of {total}</div>
+    <table>
+      <thead>
+        <tr><th></th><th>ID</th><th>Name</th><th></th></tr>
+      </thead>
+      <tbody>
+        {rows if rows else '<tr><td colspan="4" class="muted">No results</td></tr>'}
+      </tbody>
+    </table>
+    <div class=\"pager\">
+      {f'<a href="{prev_link}">Prev</a>' if prev_link else '<span class="muted">Prev</span>'}
+      {f'<a href="{next_link}">Next</a>' if next_link else '<span class="muted">Next</span>'}
+      <span class=\"muted\">|</span>
+      <a class=\"muted\" href=\"{api_link}\">api</a>
+    </div>
+  </body>
+</html>"""
+
+    home_page = """<!doctype html>
+<html>
+  <head>
+    <meta charset=\"utf-8\" />
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
+    <title>MelBet Game Launcher</title>
+    <style>
+      body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, sans-serif; margin: 24px; }
+      input { padding: 10px; font-size: 16px; width: 220px; }
+      button { padding: 10px 14px; font-size: 16px; margin-left: 8px; }
+      .hint { color: #555; margin-top: 10px; }
+    </style>
+  </head>
+  <body>
+    <h1>MelBet Demo Game Launcher</h1>
+    <form action=\"/game\" method=\"get\">
+      <input name=\"id\" placeholder=\"game id (e.g. 95426)\" />
+      <button type=\"submit\">Launch</button>
+    </form>
+    <div class=\"hint\">Tip: open <code>/game/&lt;id&gt;</code> directly.</div>
+    <div class=\"hint\"><a href=\"/games\">Browse games</a> (local list)</div>
+  </body>
+</html>"""
+
+    bodies = _BodyCache()
+
+    def _etag_matches(if_none_match: str, etag: str) -> bool:
+        if not if_none_match:
+            return False
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    def _catalog_response(
+        path: str,
+        query: str,
+        request_headers: Dict[str, str],
+        render: Callable[[_GameIndex, Dict[str, List[str]]], bytes],
+        content_type: str,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        # The body depends only on the catalog and the query string, so the
+        # index version plus a hash of the query is a strong validator; the
+        # content encoding is appended since each encoding is its own
+        # representation. The body is rendered from this same index, so a
+        # reload in between can't store new content under the old tag.
+        index = _load_games_index()
+        tag = "%s-%s" % (index.version, hashlib.sha1(f"{path}?{query}".encode("utf-8")).hexdigest()[:16])
+        encoding = _negotiate_encoding(request_headers.get("accept-encoding", ""))
+        etag = f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+        headers = {"Content-Type": content_type, "ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+
+        if _etag_matches(request_headers.get("if-none-match", ""), etag):
+            return 304, headers, b""
+
+        cached = bodies.get((tag, encoding))
+        if cached is None:
+            raw = bodies.get((tag, None))
+            if raw is None:
+                raw = (None, render(index, parse_qs(query)))
+                bodies.put((tag, None), raw)
+            cached = raw
+            if encoding and len(raw[1]) >= _COMPRESS_MIN_BYTES:
+                cached = (encoding, _encode_body(raw[1], encoding))
+            if encoding:
+                bodies.put((tag, encoding), cached)
+        content_encoding, body = cached
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        return 200, headers, body
+
+    def _image_response(
+        name: str, content_type: str, cache_control: str, request_headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        # Object names are content hashes, so the hash is the ETag.
+        etag = '"%s"' % name.rsplit("/", 1)[-1].split(".", 1)[0]
+        headers = {"Content-Type": content_type, "ETag": etag, "Cache-Control": cache_control}
+        if _etag_matches(request_headers.get("if-none-match", ""), etag):
+            return 304, headers, b""
+        try:
+            with open(image_store.object_path(name), "rb") as f:
+                return 200, headers, f.read()
+        except OSError:
+            return 404, {"Content-Type": _HTML_TYPE}, b"<h1>Not found</h1>"
+
+    def _thumb_route(path: str, request_headers: Dict[str, str]) -> Tuple[int, Dict[str, str], bytes]:
+        if path.startswith("/thumbs/"):
+            name = path[len("/thumbs/") :]
+            if image_store is None or not _IMAGE_OBJECT_NAME.match(name):
+                return 404, {"Content-Type": _HTML_TYPE}, b"<h1>Not found</h1>"
+            import mimetypes
+
+            content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+            return _image_response(name, content_type, "public, max-age=31536000, immutable", request_headers)
+
+        game_id = _to_int(path[len("/img/") :].strip("/"))
+        if game_id is None:
+            return 404, {"Content-Type": _HTML_TYPE}, b"<h1>Not found</h1>"
+        if image_store is not None:
+            image_store.refresh()
+            entry = image_store.get(game_id)
+            if entry is not None:
+                # The game may get a different image on a later mirror run,
+                # so this URL is cached for a day rather than forever.
+                return _image_response(entry["object"], entry["content_type"], "public, max-age=86400", request_headers)
+        row = _load_games_index().row_for(game_id)
+        if row is not None and row.get("img_url"):
+            return 302, {"Location": row["img_url"], "Cache-Control": "public, max-age=3600"}, b""
+        return 404, {"Content-Type": _HTML_TYPE}, b"<h1>Not found</h1>"
+
+    def _catalog_route(path: str, query: str, request_headers: Dict[str, str]) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """(status, headers, body) for the browse and catalog endpoints.
+
+        These never block on the network, so the asyncio server answers them
+        on the event loop unless _route_reads_disk says otherwise; None means
+        the path belongs to Handler.
+        """
+        if path == "/api/games":
+            return _catalog_response(
+                path, query, request_headers, lambda index, qs: json.dumps(_api_games(index, qs), ensure_ascii=False).encode("utf-8"), _JSON_TYPE
+            )
+        if path == "/games":
+            return _catalog_response(path, query, request_headers, lambda index, qs: _games_page(index, qs).encode("utf-8"), _HTML_TYPE)
+        if path.startswith(("/thumbs/", "/img/")):
+            return _thumb_route(path, request_headers)
+        if path == "/":
+            return 200, {"Content-Type": _HTML_TYPE}, home_page.encode("utf-8")
+        if path == "/api/wallet/balance":
+            return 200, {"Content-Type": _JSON_TYPE}, json.dumps({"balance": wallet.balance, "currency": "FUN"}).encode("utf-8")
+        if path == "/api/http/stats":
+            return 200, {"Content-Type": _JSON_TYPE}, json.dumps(_http_stats()).encode("utf-8")
+        return None
+
+    def _route_reads_disk(path: str) -> bool:
+        # Image files and their manifest, and rows read from a catalog
+        # database, would stall every connection on the event loop.
+        if path.startswith(("/thumbs/", "/img/")):
+            return True
+        return path in ("/games", "/api/games") and isinstance(_load_games_index().rows, _DbRows)
+
+    import http.server
+    import socketserver
+
+    class _LauncherServer(socketserver.ThreadingTCPServer):
+        # Set on the class: it has to be in place before the socket is bound.
+        allow_reuse_address = True
 
     class Handler(http.server.BaseHTTPRequestHandler):
-        def _send_html(self, status: int, html: str) -> None:
-            body = html.encode("utf-8")
+        def _send_body(self, status: int, headers: Dict[str, str], body: bytes) -> None:
             self.send_response(status)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if status != 304:
+                self.send_header("Content-Length", str(len(body)))
             self.end_headers()
             self.wfile.write(body)
 
+        def _send_html(self, status: int, html: str) -> None:
+            self._send_body(status, {"Content-Type": _HTML_TYPE}, html.encode("utf-8"))
+
         def _send_json(self, status: int, payload: Any) -> None:
-            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-            self.send_response(status)
-            self.send_header("Content-Type", "application/json; charset=utf-8")
-            self.send_header("Content-Length", str(len(body)))
-            self.end_headers()
-            self.wfile.write(body)
+            self._send_body(status, {"Content-Type": _JSON_TYPE}, json.dumps(payload, ensure_ascii=False).encode("utf-8"))
 
         def _proxy_with_asset_injection(self, target_url: str) -> None:
             """Fetch game content and inject deep modifications for full UI control."""
@@ -347,6 +1597,8 @@ def serve_launcher(
 """
             
             # Fetch the target URL
+            from urllib.request import Request, build_opener
+
             req = Request(target_url, method="GET")
             req.add_header("User-Agent", "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
             req.add_header("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
@@ -421,8 +1673,9 @@ def serve_launcher(
             parsed = urlparse(self.path)
             path = parsed.path or "/"
             qs = parse_qs(parsed.query or "")
-            if path == "/api/wallet/balance":
-                self._send_json(200, {"balance": wallet.balance, "currency": "FUN"})
+            route = _catalog_route(path, parsed.query or "", {k.lower(): v for k, v in self.headers.items()})
+            if route is not None:
+                self._send_body(*route)
                 return
 
             # Proxy endpoint - fetches game content and injects CSS to hide balance
@@ -438,138 +1691,6 @@ def serve_launcher(
                     self._send_html(500, f"<h1>Proxy error</h1><pre>{html.escape(str(e))}</pre>")
                 return
 
-            if path == "/api/games":
-                q_raw = ((qs.get("q") or [""])[0] or "").strip()
-                q = q_raw.lower()
-                try:
-                    limit = int((qs.get("limit") or ["50"])[0])
-                except Exception:
-                    limit = 50
-                try:
-                    offset = int((qs.get("offset") or ["0"])[0])
-                except Exception:
-                    offset = 0
-
-                limit = max(1, min(200, limit))
-                offset = max(0, offset)
-
-                games = _load_games_index()
-                if q:
-                    filtered = [g for g in games if q in str(g.get("id", "")).lower() or q in str(g.get("name", "")).lower()]
-                else:
-                    filtered = games
-
-                page = filtered[offset : offset + limit]
-                self._send_json(
-                    200,
-                    {
-                        "source": games_source,
-                        "total": len(filtered),
-                        "offset": offset,
-                        "limit": limit,
-                        "items": page,
-                    },
-                )
-                return
-
-            if path == "/games":
-                q_raw = ((qs.get("q") or [""])[0] or "").strip()
-                q = q_raw.lower()
-                try:
-                    limit = int((qs.get("limit") or ["50"])[0])
-                except Exception:
-                    limit = 50
-                try:
-                    offset = int((qs.get("offset") or ["0"])[0])
-                except Exception:
-                    offset = 0
-
-                limit = max(1, min(200, limit))
-                offset = max(0, offset)
-
-                games = _load_games_index()
-                if q:
-                    filtered = [g for g in games if q in str(g.get("id", "")).lower() or q in str(g.get("name", "")).lower()]
-                else:
-                    filtered = games
-
-                total = len(filtered)
-                page = filtered[offset : offset + limit]
-
-                def _make_link(new_offset: int) -> str:
-                    params: Dict[str, Any] = {"limit": limit, "offset": new_offset}
-                    if q_raw:
-                        params["q"] = q_raw
-                    return "/games?" + urlencode(params)
-
-                prev_link = _make_link(max(0, offset - limit)) if offset > 0 else ""
-                next_link = _make_link(offset + limit) if (offset + limit) < total else ""
-
-                rows = "\n".join(
-                    (
-                        "<tr>"
-                        f"<td><code>{int(g.get('id'))}</code></td>"
-                        f"<td>{html.escape(str(g.get('name') or ''))}</td>"
-                        f"<td><a href=\"/game/{int(g.get('id'))}\">Launch</a></td>"
-                        "</tr>"
-                    )
-                    for g in page
-                )
-
-                src = html.escape(games_source or "(none)")
-                self._send_html(
-                    200,
-                    f"""<!doctype html>
-<html>
-  <head>
-    <meta charset=\"utf-8\" />
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-    <title>Games</title>
-    <style>
-      body {{ font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, sans-serif; margin: 24px; }}
-      a {{ color: #2563eb; text-decoration: none; }}
-      .top {{ display:flex; gap: 12px; align-items: center; flex-wrap: wrap; }}
-      input {{ padding: 10px; font-size: 16px; width: 280px; }}
-      button {{ padding: 10px 14px; font-size: 16px; }}
-      table {{ width: 100%; border-collapse: collapse; margin-top: 16px; }}
-      th, td {{ padding: 10px; border-bottom: 1px solid #eee; text-align: left; }}
-      code {{ background: #f3f4f6; padding: 2px 6px; border-radius: 6px; }}
-      .muted {{ color: #666; }}
-      .pager {{ margin-top: 14px; display:flex; gap: 12px; align-items:center; }}
-    </style>
-  </head>
-  <body>
-    <div class=\"top\">
-      <h1 style=\"margin:0\">Games</h1>
-      <a href=\"/\">Home</a>
-      <span class=\"muted\">source: <code>{src}</code></span>
-    </div>
-    <form action=\"/games\" method=\"get\" style=\"margin-top:12px\">
-      <input name=\"q\" value=\"{html.escape(q_raw)}\" placeholder=\"search by id or name\" />
-      <input type=\"hidden\" name=\"limit\" value=\"{limit}\" />
-      <button type=\"submit\">Search</button>
-      <a href=\"/games\" style=\"margin-left:10px\">Clear</a>
-    </form>
-    <div class=\"muted\" style=\"margin-top:8px\">showing {offset + 1 if total else 0}-{min(offset + limit, total)} of {total}</div>
-    <table>
-      <thead>
-        <tr><th>ID</th><th>Name</th><th></th></tr>
-      </thead>
-      <tbody>
-        {rows if rows else '<tr><td colspan="3" class="muted">No results</td></tr>'}
-      </tbody>
-    </table>
-    <div class=\"pager\">
-      {f'<a href="{prev_link}">Prev</a>' if prev_link else '<span class="muted">Prev</span>'}
-      {f'<a href="{next_link}">Next</a>' if next_link else '<span class="muted">Next</span>'}
-      <span class=\"muted\">|</span>
-      <a class=\"muted\" href=\"/api/games?q={html.escape(q_raw)}&limit={limit}&offset={offset}\">api</a>
-    </div>
-  </body>
-</html>""",
-                )
-                return
-
             game_id: Optional[int] = None
             if path.startswith("/game/"):
                 tail = path[len("/game/"):].strip("/")
@@ -586,43 +1707,13 @@ def serve_launcher(
                     except Exception:
                         game_id = None
 
-            if path == "/":
-                self._send_html(
-                    200,
-                    """<!doctype html>
-<html>
-  <head>
-    <meta charset=\"utf-8\" />
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />
-    <title>MelBet Game Launcher</title>
-    <style>
-      body { font-family: system-ui, -apple-system, Segoe UI, Roboto, Ubuntu, Cantarell, Noto Sans, sans-serif; margin: 24px; }
-      input { padding: 10px; font-size: 16px; width: 220px; }
-      button { padding: 10px 14px; font-size: 16px; margin-left: 8px; }
-      .hint { color: #555; margin-top: 10px; }
-    </style>
-  </head>
-  <body>
-    <h1>MelBet Demo Game Launcher</h1>
-    <form action=\"/game\" method=\"get\">
-      <input name=\"id\" placeholder=\"game id (e.g. 95426)\" />
-      <button type=\"submit\">Launch</button>
-    </form>
-    <div class=\"hint\">Tip: open <code>/game/&lt;id&gt;</code> directly.</div>
-    <div class=\"hint\"><a href=\"/games\">Browse games</a> (local list)</div>
-  </body>
-</html>""",
-                )
-                return
-
             if game_id is None:
                 self._send_html(404, "<h1>Not found</h1>")
                 return
 
             try:
-                if game_id in cache:
-                    demo_url = cache[game_id]
-                else:
+                demo_url = cache.get(game_id)
+                if demo_url is None:
                     demo_url = _get_demo_link_http(
                         base_url=base_url,
                         lang=lang,
@@ -630,7 +1721,8 @@ def serve_launcher(
                         retries=retries,
                         backoff_s=backoff_s,
                     )
-                    cache[game_id] = demo_url
+                    cache.put(game_id, demo_url)
+                    cache.save()
             except Exception as e:
                 self._send_html(500, f"<h1>Failed to resolve demo url</h1><pre>{e}</pre>")
                 return
@@ -795,27 +1887,347 @@ def serve_launcher(
 
             self._send_json(404, {"error": "Not found"})
 
-    with socketserver.ThreadingTCPServer((host, port), Handler) as httpd:
-        httpd.allow_reuse_address = True
+    class _BufferedHandler(Handler):
+        # One Handler request run against in-memory buffers, so the asyncio
+        # server can hand the blocking routes to a worker thread.
+        protocol_version = "HTTP/1.1"
+
+        def setup(self) -> None:
+            self.rfile = io.BytesIO(self.request)
+            self.wfile = io.BytesIO()
+
+        def finish(self) -> None:
+            pass
+
+    def _run_buffered(raw: bytes, client: Tuple[str, int]) -> Tuple[bytes, bool]:
+        out = _BufferedHandler(raw, client, None).wfile.getvalue()
+        # Without a Content-Length (e.g. the /open redirect) the connection
+        # has to close to delimit the response.
+        return out, b"\r\ncontent-length:" in out.split(b"\r\n\r\n", 1)[0].lower()
+
+    async def _serve_asyncio(max_concurrency: int) -> None:
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        loop = asyncio.get_running_loop()
+        pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def _connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            client = writer.get_extra_info("peername") or ("", 0)
+            try:
+                while True:
+                    try:
+                        head = await reader.readuntil(b"\r\n\r\n")
+                    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                        return
+                    lines = head.decode("latin-1").split("\r\n")
+                    parts = lines[0].split(" ")
+                    if len(parts) != 3:
+                        writer.write(_http_response(400, {"Content-Type": _HTML_TYPE}, b"<h1>Bad request</h1>", False))
+                        await writer.drain()
+                        return
+                    method, target, version = parts
+                    headers: Dict[str, str] = {}
+                    for line in lines[1:]:
+                        name, sep, value = line.partition(":")
+                        if sep:
+                            headers[name.strip().lower()] = value.strip()
+                    try:
+                        length = int(headers.get("content-length") or 0)
+                    except ValueError:
+                        length = 0
+                    body = await reader.readexactly(length) if length > 0 else b""
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+
+                    async with slots:
+                        parsed = urlparse(target)
+                        route = None
+                        if method == "GET":
+                            path = parsed.path or "/"
+                            try:
+                                if _route_reads_disk(path):
+                                    route = await loop.run_in_executor(pool, _catalog_route, path, parsed.query or "", headers)
+                                else:
+                                    route = _catalog_route(path, parsed.query or "", headers)
+                            except Exception as e:
+                                route = (500, {"Content-Type": _HTML_TYPE}, f"<h1>Server error</h1><pre>{html.escape(str(e))}</pre>".encode("utf-8"))
+                        if route is not None:
+                            out = _http_response(*route, keep_alive)
+                            sys.stderr.write(f'{client[0]} - - [{time.strftime("%d/%b/%Y %H:%M:%S")}] "{lines[0]}" {route[0]} -\n')
+                        else:
+                            out, reusable = await loop.run_in_executor(pool, _run_buffered, head + body, client)
+                            keep_alive = keep_alive and reusable
+                    writer.write(out)
+                    await writer.drain()
+                    if not keep_alive:
+                        return
+            except ConnectionError:
+                pass
+            finally:
+                writer.close()
+
+        listener = await asyncio.start_server(_connection, host, port)
+        sys.stdout.write(f"Launcher running on http://{host}:{port}/ (asyncio, {max_concurrency} concurrent requests)\n")
+        try:
+            async with listener:
+                await listener.serve_forever()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    if cache.path:
+        sys.stdout.write(f"Preloaded {len(cache)} demo links from {cache.path}\n")
+    t0 = time.time()
+    index = _load_games_index()
+    sys.stdout.write(f"Indexed {len(index)} games from {index.source or '(none)'} in {time.time() - t0:.2f}s\n")
+    if reload_interval_s > 0:
+        threading.Thread(target=_watch_catalog, args=(reload_interval_s,), daemon=True).start()
+
+    if server == "asyncio":
+        import asyncio
+
+        asyncio.run(_serve_asyncio(max(1, max_concurrency)))
+        return
+
+    with _LauncherServer((host, port), Handler) as httpd:
         sys.stdout.write(f"Launcher running on http://{host}:{port}/\n")
         httpd.serve_forever()
 
 
-def _http_get_json_with_retries(opener, url: str, retries: int, backoff_s: float) -> Any:
+class _RequestTrace:
+    """Timing of one logical API request across all of its attempts."""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.attempts = 0
+        self.latency_s = 0.0
+        self.backoff_s = 0.0
+        self.bytes = 0
+        self.status = 0
+        self.cached = False
+        self.error: Optional[str] = None
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+class _CrawlMetrics:
+    """Per-page request traces of a crawl, with per-category summaries.
+
+    record() is called from fetch worker threads; everything else runs once
+    the crawl is over.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.pages: List[Dict[str, Any]] = []
+
+    def record(self, category_id: Optional[int], offset: int, trace: _RequestTrace, games: Optional[int], started_at: float) -> None:
+        row = {
+            "category_id": category_id,
+            "offset": offset,
+            "url": trace.url,
+            "started_s": round(started_at - self.started_at, 6),
+            "latency_s": round(trace.latency_s, 6),
+            "backoff_s": round(trace.backoff_s, 6),
+            "attempts": trace.attempts,
+            "retries": trace.retries,
+            "bytes": trace.bytes,
+            "status": trace.status,
+            "cached": trace.cached,
+            "games": games,
+            "error": trace.error,
+        }
+        with self._lock:
+            self.pages.append(row)
+
+    def finish(self) -> None:
+        if self.finished_at is None:
+            self.finished_at = time.monotonic()
+
+    @staticmethod
+    def _summarize(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        latencies = sorted(r["latency_s"] for r in rows)
+        ok = [r for r in rows if r["games"] is not None]
+        games = sum(r["games"] for r in ok)
+        return {
+            "pages": len(ok),
+            "failed": len(rows) - len(ok),
+            "games": games,
+            "games_per_page": round(games / len(ok), 2) if ok else 0.0,
+            "requests": sum(r["attempts"] for r in rows),
+            "retries": sum(r["retries"] for r in rows),
+            "cached": sum(1 for r in rows if r["cached"]),
+            "bytes": sum(r["bytes"] for r in rows),
+            "latency_s": {
+                "total": round(sum(latencies), 6),
+                "mean": round(sum(latencies) / len(latencies), 6) if latencies else 0.0,
+                "p50": round(_percentile(latencies, 0.50), 6),
+                "p95": round(_percentile(latencies, 0.95), 6),
+                "max": round(latencies[-1], 6) if latencies else 0.0,
+            },
+            "backoff_s": round(sum(r["backoff_s"] for r in rows), 6),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            rows = list(self.pages)
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        total = self._summarize(rows)
+        total["elapsed_s"] = round(elapsed, 6)
+        total["pages_per_s"] = round(total["pages"] / elapsed, 2) if elapsed > 0 else 0.0
+        total["games_per_s"] = round(total["games"] / elapsed, 2) if elapsed > 0 else 0.0
+        # Average number of requests in flight; well below --workers means the
+        # crawl is bound by --sleep or by the consumer, not by the server.
+        total["concurrency"] = round(total["latency_s"]["total"] / elapsed, 2) if elapsed > 0 else 0.0
+
+        by_category: Dict[Optional[int], List[Dict[str, Any]]] = {}
+        for r in rows:
+            by_category.setdefault(r["category_id"], []).append(r)
+        categories = []
+        for cid, cat_rows in by_category.items():
+            summary = self._summarize(cat_rows)
+            summary["category_id"] = cid
+            categories.append(summary)
+        return {"total": total, "categories": categories}
+
+    def report(self) -> str:
+        summary = self.summary()
+        lines = [
+            f"{'category':>10} {'pages':>6} {'games':>7} {'g/page':>7} {'retries':>7} {'failed':>6} "
+            f"{'KiB':>8} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'backoff s':>9}"
+        ]
+        for c in summary["categories"] + [dict(summary["total"], category_id="total")]:
+            lat = c["latency_s"]
+            label = "-" if c["category_id"] is None else str(c["category_id"])
+            lines.append(
+                f"{label:>10} {c['pages']:>6} {c['games']:>7} {c['games_per_page']:>7.1f} {c['retries']:>7} {c['failed']:>6} "
+                f"{c['bytes'] / 1024:>8.1f} {lat['mean'] * 1e3:>8.1f} {lat['p50'] * 1e3:>8.1f} {lat['p95'] * 1e3:>8.1f} "
+                f"{c['backoff_s']:>9.2f}"
+            )
+        t = summary["total"]
+        lines.append(
+            f"{t['elapsed_s']:.2f}s elapsed, {t['pages_per_s']:.1f} pages/s, {t['games_per_s']:.1f} games/s, "
+            f"{t['cached']} from cache, {t['concurrency']:.2f} requests in flight on average"
+        )
+        return "\n".join(lines) + "\n"
+
+    def save(self, path: str) -> None:
+        payload = self.summary()
+        with self._lock:
+            payload["pages"] = list(self.pages)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+
+_MAX_RETRY_AFTER_S = 600.0
+
+
+def _retry_after_s(value: Optional[str]) -> Optional[float]:
+    """Seconds asked for by a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        import email.utils
+
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError):
+            return None
+    return min(_MAX_RETRY_AFTER_S, max(0.0, seconds))
+
+
+def _backoff_delay(backoff_s: float, attempt: int, retry_after_s: Optional[float] = None) -> float:
+    # Equal jitter: half of the exponential step is fixed, half random, so
+    # workers that failed together do not retry in lockstep. The server's
+    # Retry-After, when given, is a floor.
+    step = backoff_s * (2**attempt)
+    delay = step / 2 + random.uniform(0, step / 2)
+    return max(delay, retry_after_s or 0.0)
+
+
+def _http_get_json_with_retries(
+    session,
+    url: str,
+    retries: int,
+    backoff_s: float,
+    cache: Optional[_HttpCache] = None,
+    trace: Optional[_RequestTrace] = None,
+    controller: Optional["_AdaptiveController"] = None,
+) -> Any:
+    if trace is None:
+        trace = _RequestTrace(url)
+    key = _HttpCache.key_for(session, url) if cache is not None else ""
+    entry = cache.get(key) if cache is not None else None
+    if cache is not None:
+        if entry is not None and cache.is_fresh(entry):
+            trace.cached = True
+            trace.bytes = len(entry.body)
+            return json.loads(entry.body.decode("utf-8", errors="replace"))
+        if cache.offline:
+            trace.error = "not in cache"
+            raise RuntimeError(f"Not in cache: {url}")
+
     last_err: Optional[str] = None
     for attempt in range(retries + 1):
+        trace.attempts += 1
+        retry_after: Optional[float] = None
+        t0 = time.monotonic()
         try:
-            text = _http_get_text(opener, url, timeout_s=30)
+            headers: Dict[str, str] = {}
+            if entry is not None and entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry is not None and entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            status, resp_headers, data = _http_get(session, url, timeout_s=30, headers=headers)
+            trace.latency_s += time.monotonic() - t0
+            trace.status = status
+            trace.bytes += len(data)
+            if status == 304 and entry is not None and cache is not None:
+                cache.touch(key)
+                trace.cached = True
+                return json.loads(entry.body.decode("utf-8", errors="replace"))
+            text = data.decode("utf-8", errors="replace")
             if text:
-                return json.loads(text)
+                j = json.loads(text)
+                if cache is not None:
+                    cache.put(key, data, resp_headers.get("ETag"), resp_headers.get("Last-Modified"))
+                trace.error = None
+                return j
             last_err = f"empty_response text_len={len(text)}"
         except (HTTPError, URLError, TimeoutError) as e:
+            trace.latency_s += time.monotonic() - t0
+            trace.status = getattr(e, "code", 0) or 0
+            if isinstance(e, HTTPError) and e.headers is not None:
+                retry_after = _retry_after_s(e.headers.get("Retry-After"))
             last_err = str(e)
         except Exception as e:
+            trace.latency_s += time.monotonic() - t0
             last_err = str(e)
+        trace.error = last_err
+        if controller is not None:
+            controller.on_error(trace.status, retry_after)
 
         if attempt < retries:
-            time.sleep(backoff_s * (2**attempt))
+            delay = _backoff_delay(backoff_s, attempt, retry_after)
+            time.sleep(delay)
+            trace.backoff_s += delay
+            if controller is not None:
+                # Retries take a slot too, or workers that failed together
+                # come back as one burst.
+                controller.wait()
 
     raise RuntimeError(f"Failed to fetch JSON: {url} ({last_err})")
 
@@ -832,28 +2244,115 @@ async def _fetch_json_via_page_fetch(page, url: str) -> Any:
     }
   });
   const status = res.status;
+  const retryAfter = res.headers.get('retry-after');
   const text = await res.text();
-  return { status, text };
+  return { status, retryAfter, text };
 }""",
         url,
     )
 
 
-async def _get_json_with_retries(page, url: str, retries: int, backoff_s: float) -> Any:
+# Game keys _parse_games reads; the in-page batch fetch drops the rest before
+# the response crosses the DevTools protocol.
+_API_GAME_KEYS = (
+    "id",
+    "name",
+    "brandId",
+    "brandName",
+    "provider_id",
+    "product_id",
+    "categories",
+    "has_demo",
+    "is_new",
+    "is_promo",
+    "is_hot",
+    "img",
+)
+
+
+async def _fetch_json_batch_via_page(page, urls: List[str]) -> List[Dict[str, Any]]:
+    # All fetches run concurrently inside the page and come back as one JSON
+    # string: a single evaluate round trip and a single json.loads per batch.
+    text = await page.evaluate(
+        """async ({ urls, keys }) => {
+  const one = async (url) => {
+    try {
+      const res = await fetch(url, {
+        method: 'GET',
+        credentials: 'include',
+        headers: {
+          'accept': 'application/json, text/plain, */*',
+          'x-requested-with': 'XMLHttpRequest'
+        }
+      });
+      const text = await res.text();
+      const out = { status: res.status, retryAfter: res.headers.get('retry-after'), bytes: text.length };
+      if (res.status === 200 && text) {
+        const j = JSON.parse(text);
+        if (j && Array.isArray(j.games)) {
+          j.games = j.games.map((g) => {
+            if (!g || typeof g !== 'object') return null;
+            const picked = {};
+            for (const k of keys) if (k in g) picked[k] = g[k];
+            return picked;
+          });
+        }
+        out.json = j;
+      }
+      return out;
+    } catch (e) {
+      return { status: 0, error: String(e) };
+    }
+  };
+  return JSON.stringify(await Promise.all(urls.map(one)));
+}""",
+        {"urls": urls, "keys": list(_API_GAME_KEYS)},
+    )
+    return json.loads(text)
+
+
+async def _get_json_with_retries(
+    page,
+    url: str,
+    retries: int,
+    backoff_s: float,
+    trace: Optional[_RequestTrace] = None,
+    controller: Optional["_AdaptiveController"] = None,
+) -> Any:
+    import asyncio
+
+    if trace is None:
+        trace = _RequestTrace(url)
     last_err: Optional[str] = None
     for attempt in range(retries + 1):
+        trace.attempts += 1
+        retry_after: Optional[float] = None
+        t0 = time.monotonic()
         try:
             payload = await _fetch_json_via_page_fetch(page, url)
             status = int(payload.get("status") or 0)
             text = payload.get("text") or ""
+            retry_after = _retry_after_s(payload.get("retryAfter"))
+            trace.status = status
+            trace.bytes += len(text)
             if status == 200 and text:
+                trace.latency_s += time.monotonic() - t0
+                trace.error = None
                 return json.loads(text)
             last_err = f"status={status} text_len={len(text)}"
         except Exception as e:
             last_err = str(e)
+        trace.latency_s += time.monotonic() - t0
+        trace.error = last_err
+        if controller is not None:
+            controller.on_error(trace.status, retry_after)
 
         if attempt < retries:
-            await asyncio.sleep(backoff_s * (2**attempt))
+            delay = _backoff_delay(backoff_s, attempt, retry_after)
+            await asyncio.sleep(delay)
+            trace.backoff_s += delay
+            if controller is not None:
+                await asyncio.sleep(controller.delay())
 
     raise RuntimeError(f"Failed to fetch JSON: {url} ({last_err})")
 
@@ -870,95 +2369,943 @@ async def _get_options(page, base_url: str, retries: int, backoff_s: float) -> D
     return {}
 
 
-def _get_options_http(opener, base_url: str, retries: int, backoff_s: float) -> Dict[str, Any]:
+def _get_options_http(
+    session,
+    base_url: str,
+    retries: int,
+    backoff_s: float,
+    cache: Optional[_HttpCache] = None,
+) -> Dict[str, Any]:
     url = _build_api_url(
         base_url,
         "/web-api/tpmodels/options/1",
         {"optionsKeys": "brands,subcategories,banners"},
     )
-    api_json = _http_get_json_with_retries(opener, url, retries=retries, backoff_s=backoff_s)
+    api_json = _http_get_json_with_retries(session, url, retries=retries, backoff_s=backoff_s, cache=cache)
     if isinstance(api_json, dict):
         return api_json
     return {}
 
 
+def _page_record_count(api_json: Any) -> int:
+    games = (api_json or {}).get("games") if isinstance(api_json, dict) else None
+    return len(games) if isinstance(games, list) else 0
+
+
 def _parse_games(api_json: Any, base_url: str, lang: str) -> List[Game]:
     games = (api_json or {}).get("games")
     if not isinstance(games, list):
         return []
 
+    # Hot path of every crawl: the API sends ints, strings and bools, so the
+    # type checks below skip the generic conversions for all but odd records,
+    # and a clean categories list is kept as is instead of being copied.
     out: List[Game] = []
+    append = out.append
+    new_game = Game.__new__
     base_url = base_url.rstrip("/")
+    game_url_prefix = f"{base_url}/{lang}/slots?game="
     for g in games:
         if not isinstance(g, dict):
             continue
-        game_id = _to_int(g.get("id"))
-        if game_id is None:
-            continue
-        img = g.get("img")
-        img_url = f"{base_url}{img}" if isinstance(img, str) and img.startswith("/") else None
-        game_url = f"{base_url}/{lang}/slots?game={game_id}"
-
-        categories_val = g.get("categories")
-        categories: List[int] = []
-        if isinstance(categories_val, list):
-            categories = [c for c in (_to_int(x) for x in categories_val) if c is not None]
+        get = g.get
+        game_id = get("id")
+        if type(game_id) is not int:
+            game_id = _to_int(game_id)
+            if game_id is None:
+                continue
+        name = get("name")
+        if type(name) is not str:
+            name = str(name or "")
+        brand_id, provider_id, product_id = get("brandId"), get("provider_id"), get("product_id")
+        if type(brand_id) is not int:
+            brand_id = _to_int(brand_id)
+        if type(provider_id) is not int:
+            provider_id = _to_int(provider_id)
+        if type(product_id) is not int:
+            product_id = _to_int(product_id)
+        brand_name = get("brandName")
+        if brand_name is not None and type(brand_name) is not str:
+            brand_name = str(brand_name)
+
+        categories = get("categories")
+        if type(categories) is not list:
+            categories = []
+        else:
+            for c in categories:
+                if type(c) is not int:
+                    categories = [c for c in (_to_int(x) for x in categories) if c is not None]
+                    break
 
-        out.append(
-            Game(
-                id=game_id,
-                name=str(g.get("name") or ""),
-                brand_id=_to_int(g.get("brandId")),
-                brand_name=(str(g.get("brandName")) if g.get("brandName") is not None else None),
-                provider_id=_to_int(g.get("provider_id")),
-                product_id=_to_int(g.get("product_id")),
-                categories=categories,
-                has_demo=(bool(g.get("has_demo")) if g.get("has_demo") is not None else None),
-                is_new=(bool(g.get("is_new")) if g.get("is_new") is not None else None),
-                is_promo=(bool(g.get("is_promo")) if g.get("is_promo") is not None else None),
-                is_hot=(bool(g.get("is_hot")) if g.get("is_hot") is not None else None),
-                img=(str(img) if img is not None else None),
-                img_url=img_url,
-                game_url=game_url,
+        has_demo, is_new, is_promo, is_hot = get("has_demo"), get("is_new"), get("is_promo"), get("is_hot")
+        img = get("img")
+        if type(img) is str:
+            img_url = f"{base_url}{img}" if img.startswith("/") else None
+        else:
+            img, img_url = (None if img is None else str(img)), None
+
+        append(
+            new_game(
+                Game,
+                game_id,
+                name,
+                brand_id,
+                brand_name,
+                provider_id,
+                product_id,
+                categories,
+                None if has_demo is None else bool(has_demo),
+                None if is_new is None else bool(is_new),
+                None if is_promo is None else bool(is_promo),
+                None if is_hot is None else bool(is_hot),
+                img,
+                img_url,
+                f"{game_url_prefix}{game_id}",
+                None,
             )
         )
 
     return out
 
 
-def _dedupe(games: Iterable[Game]) -> List[Game]:
-    seen = set()
-    out: List[Game] = []
+class _GameStore:
+    """Insertion-ordered games keyed by id.
+
+    Admitting a page costs O(page size). A game seen again (typically from
+    another category) keeps its first position but its category membership
+    is merged with the new copy and with the category it was found under.
+
+    Once `max_games` games are admitted further new ids are ignored. With
+    `on_add` every batch of newly admitted games is handed over as it
+    arrives; together with `keep_records=False` only ids are retained, so a
+    streamed crawl stays flat in memory (and membership merging is skipped,
+    since the record has already been written).
+    """
+
+    def __init__(
+        self,
+        max_games: int = 0,
+        on_add: Optional[Callable[[List[Game]], None]] = None,
+        keep_records: bool = True,
+    ) -> None:
+        self.max_games = max_games
+        self._on_add = on_add
+        self._keep_records = keep_records
+        self._games: Dict[int, Optional[Game]] = {}
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self._games
+
+    def full(self) -> bool:
+        return _cap_reached(len(self._games), self.max_games)
+
+    def mark_seen(self, game_ids: Iterable[int]) -> None:
+        for game_id in game_ids:
+            self._games.setdefault(game_id, None)
+
+    def add(self, games: Iterable[Game], category_id: Optional[int] = None) -> List[Game]:
+        added: List[Game] = []
+        for g in games:
+            if g.id not in self._games:
+                if self.full():
+                    continue
+                if category_id is not None and category_id not in g.categories:
+                    g = g._replace(categories=sorted(set(g.categories) | {category_id}))
+                self._games[g.id] = g if self._keep_records else None
+                added.append(g)
+                continue
+            prev = self._games[g.id]
+            if prev is None:
+                continue
+            extra = set(g.categories)
+            if category_id is not None:
+                extra.add(category_id)
+            if not extra.issubset(prev.categories):
+                self._games[g.id] = prev._replace(categories=sorted(extra.union(prev.categories)))
+        if added and self._on_add is not None:
+            self._on_add(added)
+        return added
+
+    def games(self) -> List[Game]:
+        return [g for g in self._games.values() if g is not None]
+
+
+_GAME_FIELDS = [name for name in Game._fields if name != "names"]
+_CATEGORIES_POS = Game._fields.index("categories")
+
+# json.dumps(..., ensure_ascii=False) builds a new encoder per call.
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+_JSON_KEYS = [f'\n    {_json_encode(name)}: ' for name in Game._fields]
+
+
+def _game_row(g: Game) -> Dict[str, Any]:
+    row = g._asdict()
+    if row["names"] is None:
+        del row["names"]
+    return row
+
+
+def _json_scalar(v: Any) -> str:
+    if v is None:
+        return "null"
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    if type(v) is int:
+        return int.__repr__(v)
+    return _json_encode(v)
+
+
+def _json_record(g: Game) -> str:
+    """json.dumps(_game_row(g), ensure_ascii=False, indent=2), indented one level deeper."""
+    parts = []
+    # names is the last field and is left out when unset.
+    for key, v in zip(_JSON_KEYS if g.names is not None else _JSON_KEYS[:-1], g):
+        if type(v) is list:
+            v = "[\n      " + ",\n      ".join(map(_json_scalar, v)) + "\n    ]" if v else "[]"
+        elif type(v) is dict:
+            items = [f"{_json_encode(str(k))}: {_json_scalar(x)}" for k, x in v.items()]
+            v = "{\n      " + ",\n      ".join(items) + "\n    }" if items else "{}"
+        else:
+            v = _json_scalar(v)
+        parts.append(key + v)
+    return "{" + ",".join(parts) + "\n  }"
+
+
+def _write_json(path: str, games: Iterable[Game]) -> None:
+    # Same bytes as json.dump(list, indent=2), one record at a time.
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        sep = "\n  "
+        for g in games:
+            f.write(sep)
+            f.write(_json_record(g))
+            sep = ",\n  "
+        f.write("]" if sep == "\n  " else "\n]")
+
+
+def _drop_partial_line(path: str) -> None:
+    # A crash mid-write can leave a truncated last record; cut back to the last newline.
+    with open(path, "rb+") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        if end == 0:
+            return
+        pos = end
+        while pos > 0:
+            step = min(4096, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            i = chunk.rfind(b"\n")
+            if i >= 0:
+                if pos - step + i + 1 != end:
+                    f.truncate(pos - step + i + 1)
+                return
+            pos -= step
+        f.truncate(0)
+
+
+class _StreamWriter:
+    """Writes games to a JSON Lines or CSV file as soon as they are scraped.
+
+    The file is flushed at most every `flush_every_s` seconds and on close.
+    With `append` an existing file is continued after dropping any partially
+    written last line.
+    """
+
+    def __init__(self, path: str, fmt: str, append: bool = False, flush_every_s: float = 1.0, localized: bool = False):
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported streaming format: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.flush_every_s = flush_every_s
+        self.count = 0
+        has_data = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if has_data:
+            _drop_partial_line(path)
+            has_data = os.path.getsize(path) > 0
+        self._f = open(path, "a" if append else "w", newline="" if fmt == "csv" else None, encoding="utf-8")
+        self._localized = localized
+        self._csv: Any = None
+        if fmt == "csv":
+            self._csv = csv.writer(self._f)
+            if not has_data:
+                self._csv.writerow(_GAME_FIELDS + (["names"] if localized else []))
+        self._last_flush = time.monotonic()
+
+    def write(self, games: Iterable[Game]) -> None:
+        # Rows go out straight from the record tuples, in Game field order.
+        for g in games:
+            if self._csv is not None:
+                row = list(g)
+                row[_CATEGORIES_POS] = json.dumps(g.categories or [])
+                names = row.pop()
+                if self._localized:
+                    row.append(_json_encode(names) if names else "")
+                self._csv.writerow(row)
+            else:
+                self._f.write(_json_encode(_game_row(g)))
+                self._f.write("\n")
+            self.count += 1
+        if time.monotonic() - self._last_flush >= self.flush_every_s:
+            self.flush()
+
+    def flush(self) -> None:
+        self._f.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "_StreamWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _write_csv(path: str, games: Iterable[Game], localized: bool = False) -> None:
+    with _StreamWriter(path, "csv", localized=localized) as w:
+        w.write(games)
+
+
+def _game_from_dict(d: Dict[str, Any]) -> Optional[Game]:
+    game_id = _to_int(d.get("id"))
+    if game_id is None:
+        return None
+    categories_val = d.get("categories")
+    categories: List[int] = []
+    if isinstance(categories_val, str):
+        try:
+            categories_val = json.loads(categories_val)
+        except Exception:
+            categories_val = None
+    if isinstance(categories_val, list):
+        categories = [c for c in (_to_int(x) for x in categories_val) if c is not None]
+    names_val = d.get("names")
+    if isinstance(names_val, str):
+        try:
+            names_val = json.loads(names_val) if names_val else None
+        except Exception:
+            names_val = None
+    names = {str(k): str(v) for k, v in names_val.items()} if isinstance(names_val, dict) and names_val else None
+
+    def _opt_bool(v: Any) -> Optional[bool]:
+        if v is None or v == "":
+            return None
+        if isinstance(v, str):
+            return v.strip().lower() in ("1", "true", "yes")
+        return bool(v)
+
+    def _opt_str(v: Any) -> Optional[str]:
+        return str(v) if v is not None and v != "" else None
+
+    return Game(
+        id=game_id,
+        name=str(d.get("name") or ""),
+        brand_id=_to_int(d.get("brand_id")),
+        brand_name=_opt_str(d.get("brand_name")),
+        provider_id=_to_int(d.get("provider_id")),
+        product_id=_to_int(d.get("product_id")),
+        categories=categories,
+        has_demo=_opt_bool(d.get("has_demo")),
+        is_new=_opt_bool(d.get("is_new")),
+        is_promo=_opt_bool(d.get("is_promo")),
+        is_hot=_opt_bool(d.get("is_hot")),
+        img=_opt_str(d.get("img")),
+        img_url=_opt_str(d.get("img_url")),
+        game_url=_opt_str(d.get("game_url")),
+        names=names,
+    )
+
+
+def _iter_games_file(path: str) -> Iterator[Game]:
+    """Reads any output this script writes (JSON, JSON Lines, CSV, melcat or a catalog database)."""
+    lower = path.lower()
+    if lower.endswith(".melcat"):
+        catalog = _ColumnarCatalog(path)
+        try:
+            yield from catalog
+        finally:
+            catalog.close()
+        return
+    if _is_catalog_db(path):
+        db = _CatalogDb(path, readonly=True)
+        try:
+            yield from db.iter_games()
+        finally:
+            db.close()
+        return
+    with open(path, "r", newline="" if lower.endswith(".csv") else None, encoding="utf-8") as f:
+        if lower.endswith(".jsonl"):
+            rows: Iterable[Any] = (json.loads(line) for line in f if line.strip())
+        elif lower.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            rows = json.load(f)
+            if not isinstance(rows, list):
+                raise ValueError(f"{path}: expected a JSON list of games")
+        for d in rows:
+            if isinstance(d, dict):
+                g = _game_from_dict(d)
+                if g is not None:
+                    yield g
+
+
+def _read_games_file(path: str) -> List[Game]:
+    return list(_iter_games_file(path))
+
+
+_MELCAT_MAGIC = b"MELCAT1\0"
+
+
+class _ColumnarCatalog:
+    """Read-only view of a `.melcat` catalog, memory-mapped.
+
+    Layout: magic, a little-endian uint32 header length, a JSON header, then
+    8-byte aligned column sections (positions listed in the header). Ids,
+    brand/provider/product ids and the category offsets/values (CSR packing
+    of each game's category list) are int32 arrays with -1 for "unknown";
+    each tri-state flag takes two bits of one byte per game; brand names are
+    interned in the header; names and image paths are UTF-8 blobs with int32
+    offsets. img_url and game_url are rebuilt from the header's base_url/lang
+    unless stored explicitly. Nothing is decoded until it is asked for.
+    """
+
+    FLAGS = ("has_demo", "is_new", "is_promo", "is_hot")
+
+    def __init__(self, path: str):
+        import mmap
+
+        if sys.byteorder != "little":
+            raise RuntimeError("melcat catalogs are little-endian only")
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        buf = memoryview(self._mm)
+        if bytes(buf[:8]) != _MELCAT_MAGIC:
+            raise ValueError(f"{path}: not a melcat catalog")
+        header_len = int.from_bytes(buf[8:12], "little")
+        self.header: Dict[str, Any] = json.loads(bytes(buf[12 : 12 + header_len]).decode("utf-8"))
+        self.base_url: str = self.header["base_url"]
+        self.lang: str = self.header["lang"]
+        self.brands: List[str] = self.header["brands"]
+        self._n = int(self.header["count"])
+        data_start = (12 + header_len + 7) & ~7
+        self._cols: Dict[str, memoryview] = {}
+        for name, (start, length, typecode) in self.header["sections"].items():
+            start += data_start
+            self._cols[name] = buf[start : start + length].cast(typecode)
+        self._index: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    def close(self) -> None:
+        self._cols.clear()
+        self._mm.close()
+
+    @property
+    def ids(self) -> memoryview:
+        return self._cols["id"]
+
+    def _str(self, column: str, i: int) -> Optional[str]:
+        offsets = self._cols[f"{column}_offsets"]
+        start, end = offsets[i], offsets[i + 1]
+        if start < 0:
+            return None
+        if end < 0:
+            end = -end - 1
+        return bytes(self._cols[f"{column}_data"][start:end]).decode("utf-8")
+
+    def name(self, i: int) -> str:
+        return self._str("name", i) or ""
+
+    def categories(self, i: int) -> List[int]:
+        offsets = self._cols["cat_offsets"]
+        return self._cols["cat_values"][offsets[i] : offsets[i + 1]].tolist()
+
+    def flag(self, i: int, flag: str) -> Optional[bool]:
+        bits = self._cols["flags"][i] >> (2 * self.FLAGS.index(flag))
+        return bool(bits & 2) if bits & 1 else None
+
+    def index_of(self, game_id: int) -> Optional[int]:
+        if self._index is None:
+            self._index = {gid: i for i, gid in enumerate(self.ids)}
+        return self._index.get(game_id)
+
+    def game(self, i: int) -> Game:
+        def _opt(v: int) -> Optional[int]:
+            return None if v < 0 else v
+
+        brand_idx = self._cols["brand_name"][i]
+        img = self._str("img", i)
+        if "img_url_offsets" in self._cols:
+            img_url = self._str("img_url", i)
+        else:
+            img_url = f"{self.base_url}{img}" if img is not None and img.startswith("/") else None
+        if "game_url_offsets" in self._cols:
+            game_url = self._str("game_url", i)
+        else:
+            game_url = f"{self.base_url}/{self.lang}/slots?game={self.ids[i]}"
+        return Game(
+            id=self.ids[i],
+            name=self.name(i),
+            brand_id=_opt(self._cols["brand_id"][i]),
+            brand_name=self.brands[brand_idx] if brand_idx >= 0 else None,
+            provider_id=_opt(self._cols["provider_id"][i]),
+            product_id=_opt(self._cols["product_id"][i]),
+            categories=self.categories(i),
+            has_demo=self.flag(i, "has_demo"),
+            is_new=self.flag(i, "is_new"),
+            is_promo=self.flag(i, "is_promo"),
+            is_hot=self.flag(i, "is_hot"),
+            img=img,
+            img_url=img_url,
+            game_url=game_url,
+        )
+
+    def __iter__(self) -> Iterator[Game]:
+        for i in range(self._n):
+            yield self.game(i)
+
+
+def _write_columnar(path: str, games: Iterable[Game]) -> None:
+    from array import array
+
+    games = list(games)
+    if array("i").itemsize != 4:
+        raise RuntimeError("melcat needs a 4-byte C int")
+
+    base_url, lang = "", "en"
     for g in games:
-        if g.id in seen:
-            continue
-        seen.add(g.id)
-        out.append(g)
-    return out
+        if g.game_url:
+            parts = urlparse(g.game_url)
+            base_url = f"{parts.scheme}://{parts.netloc}"
+            lang = parts.path.strip("/").split("/")[0] or lang
+            break
+
+    def _int(v: Optional[int]) -> int:
+        return -1 if v is None else int(v)
+
+    def _strings(values: List[Optional[str]]) -> Tuple[bytes, array]:
+        # A missing value is stored as -(offset + 1): the position survives
+        # for the previous entry's end while the sign marks "None".
+        data = bytearray()
+        offsets = array("i")
+        for v in values:
+            if v is None:
+                offsets.append(-len(data) - 1)
+            else:
+                offsets.append(len(data))
+                data += v.encode("utf-8")
+        offsets.append(len(data))
+        return bytes(data), offsets
+
+    brands: List[str] = []
+    brand_idx: Dict[str, int] = {}
+    cols: Dict[str, Tuple[str, bytes]] = {}
+    ids, brand_ids, provider_ids, product_ids, brand_names = (array("i") for _ in range(5))
+    cat_offsets, cat_values = array("i", [0]), array("i")
+    flags = array("B")
+    for g in games:
+        ids.append(g.id)
+        brand_ids.append(_int(g.brand_id))
+        provider_ids.append(_int(g.provider_id))
+        product_ids.append(_int(g.product_id))
+        if g.brand_name is None:
+            brand_names.append(-1)
+        else:
+            if g.brand_name not in brand_idx:
+                brand_idx[g.brand_name] = len(brands)
+                brands.append(g.brand_name)
+            brand_names.append(brand_idx[g.brand_name])
+        cat_values.extend(g.categories)
+        cat_offsets.append(len(cat_values))
+        bits = 0
+        for k, flag in enumerate(_ColumnarCatalog.FLAGS):
+            v = getattr(g, flag)
+            if v is not None:
+                bits |= (1 | (2 if v else 0)) << (2 * k)
+        flags.append(bits)
+
+    for name, arr in (
+        ("id", ids),
+        ("brand_id", brand_ids),
+        ("provider_id", provider_ids),
+        ("product_id", product_ids),
+        ("brand_name", brand_names),
+        ("cat_offsets", cat_offsets),
+        ("cat_values", cat_values),
+        ("flags", flags),
+    ):
+        cols[name] = (arr.typecode, arr.tobytes())
+
+    string_columns = ["name", "img"]
+    if any(g.img_url != (f"{base_url}{g.img}" if g.img is not None and g.img.startswith("/") else None) for g in games):
+        string_columns.append("img_url")
+    if any(g.game_url != f"{base_url}/{lang}/slots?game={g.id}" for g in games):
+        string_columns.append("game_url")
+    for column in string_columns:
+        data, offsets = _strings([getattr(g, column) for g in games])
+        cols[f"{column}_offsets"] = ("i", offsets.tobytes())
+        cols[f"{column}_data"] = ("B", data)
+
+    # Section positions are relative to the first 8-byte boundary after the header.
+    sections: Dict[str, Any] = {}
+    pos = 0
+    for name, (typecode, data) in cols.items():
+        sections[name] = [pos, len(data), typecode]
+        pos = (pos + len(data) + 7) & ~7
+    header = {"count": len(games), "base_url": base_url, "lang": lang, "brands": brands, "sections": sections}
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data_start = (12 + len(header_bytes) + 7) & ~7
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_MELCAT_MAGIC)
+        f.write(len(header_bytes).to_bytes(4, "little"))
+        f.write(header_bytes)
+        for name, (_typecode, data) in cols.items():
+            f.write(b"\0" * (data_start + sections[name][0] - f.tell()))
+            f.write(data)
+    os.replace(tmp, path)
+
+
+_CATALOG_DB_SUFFIXES = (".sqlite", ".sqlite3", ".db")
+
+
+def _is_catalog_db(path: str) -> bool:
+    return path.lower().endswith(_CATALOG_DB_SUFFIXES)
+
+
+class _CatalogDb:
+    """Catalog store with history in a single SQLite file.
+
+    games holds one row per game ever scraped with the time it was first and
+    last seen; brands and categories are keyed by id and game_categories is
+    the membership table, in each game's own category order. `seq` keeps the
+    order games were first stored in, so it only grows. Each `upsert` is one
+    transaction and is logged in scrapes. Reads stream rows off a cursor and
+    never load the catalog.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS brands (id INTEGER PRIMARY KEY, name TEXT)",
+        "CREATE TABLE IF NOT EXISTS categories (id INTEGER PRIMARY KEY, name TEXT, parent_id INTEGER)",
+        "CREATE TABLE IF NOT EXISTS games ("
+        " id INTEGER PRIMARY KEY, seq INTEGER NOT NULL, name TEXT NOT NULL, brand_id INTEGER, provider_id INTEGER,"
+        " product_id INTEGER, has_demo INTEGER, is_new INTEGER, is_promo INTEGER, is_hot INTEGER, img TEXT,"
+        " img_url TEXT, game_url TEXT, names TEXT, first_seen REAL NOT NULL, last_seen REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS game_categories ("
+        " game_id INTEGER NOT NULL, pos INTEGER NOT NULL, category_id INTEGER NOT NULL, PRIMARY KEY (game_id, pos))"
+        " WITHOUT ROWID",
+        "CREATE TABLE IF NOT EXISTS scrapes (id INTEGER PRIMARY KEY, at REAL NOT NULL, source TEXT, games INTEGER, added INTEGER)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS games_seq ON games (seq)",
+        "CREATE INDEX IF NOT EXISTS games_brand ON games (brand_id, first_seen)",
+        "CREATE INDEX IF NOT EXISTS games_provider ON games (provider_id)",
+        "CREATE INDEX IF NOT EXISTS games_first_seen ON games (first_seen)",
+        "CREATE INDEX IF NOT EXISTS games_last_seen ON games (last_seen)",
+        "CREATE INDEX IF NOT EXISTS game_categories_category ON game_categories (category_id, game_id)",
+    )
+
+    _SELECT = (
+        "SELECT g.id, g.name, g.brand_id, b.name, g.provider_id, g.product_id,"
+        " (SELECT group_concat(category_id) FROM (SELECT category_id FROM game_categories m WHERE m.game_id = g.id ORDER BY pos)),"
+        " g.has_demo, g.is_new, g.is_promo, g.is_hot, g.img, g.img_url, g.game_url, g.names"
+        " FROM games g LEFT JOIN brands b ON b.id = g.brand_id"
+    )
 
+    def __init__(self, path: str, readonly: bool = False):
+        import sqlite3
+
+        if readonly and not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self._lock = threading.Lock()
+        # No WAL: every commit then changes the main file, which is what the
+        # launcher's reload watches.
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30.0)
+        if readonly:
+            if not self._db.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'games'").fetchone():
+                self._db.close()
+                raise ValueError(f"{path}: not a catalog database")
+        else:
+            for statement in self._SCHEMA:
+                self._db.execute(statement)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    @staticmethod
+    def _game(row: Tuple[Any, ...]) -> Game:
+        def _opt_bool(v: Optional[int]) -> Optional[bool]:
+            return None if v is None else bool(v)
+
+        return Game(
+            id=row[0],
+            name=row[1],
+            brand_id=row[2],
+            brand_name=row[3],
+            provider_id=row[4],
+            product_id=row[5],
+            categories=[int(c) for c in row[6].split(",")] if row[6] else [],
+            has_demo=_opt_bool(row[7]),
+            is_new=_opt_bool(row[8]),
+            is_promo=_opt_bool(row[9]),
+            is_hot=_opt_bool(row[10]),
+            img=row[11],
+            img_url=row[12],
+            game_url=row[13],
+            names=json.loads(row[14]) if row[14] else None,
+        )
 
-def _write_json(path: str, games: List[Game]) -> None:
-    payload = [asdict(g) for g in games]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    def upsert(self, games: Iterable[Game], source: Optional[str] = None, at: Optional[float] = None) -> Dict[str, int]:
+        """Stores a scrape; returns {"games": n, "added": first seen now}."""
+        now = time.time() if at is None else at
 
+        def _flag(v: Optional[bool]) -> Optional[int]:
+            return None if v is None else int(v)
 
-def _write_csv(path: str, games: List[Game]) -> None:
-    rows = [asdict(g) for g in games]
-    fieldnames = list(rows[0].keys()) if rows else [k for k in asdict(Game(0, "", None, None, None, None, [], None, None, None, None, None, None, None)).keys()]
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            r = dict(r)
-            r["categories"] = json.dumps(r.get("categories") or [])
-            w.writerow(r)
+        n = 0
+        with self._lock:
+            db = self._db
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                seq = db.execute("SELECT IFNULL(MAX(seq), -1) + 1 FROM games").fetchone()[0]
+                before = db.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+                for g in games:
+                    if g.brand_id is not None:
+                        db.execute(
+                            "INSERT INTO brands (id, name) VALUES (?, ?)"
+                            " ON CONFLICT(id) DO UPDATE SET name = IFNULL(excluded.name, brands.name)",
+                            (g.brand_id, g.brand_name),
+                        )
+                    db.execute(
+                        "INSERT INTO games (id, seq, name, brand_id, provider_id, product_id, has_demo, is_new,"
+                        " is_promo, is_hot, img, img_url, game_url, names, first_seen, last_seen)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT(id) DO UPDATE SET name = excluded.name, brand_id = excluded.brand_id,"
+                        " provider_id = excluded.provider_id, product_id = excluded.product_id,"
+                        " has_demo = excluded.has_demo, is_new = excluded.is_new, is_promo = excluded.is_promo,"
+                        " is_hot = excluded.is_hot, img = excluded.img, img_url = excluded.img_url,"
+                        " game_url = excluded.game_url, names = IFNULL(excluded.names, games.names),"
+                        " last_seen = excluded.last_seen",
+                        (
+                            g.id,
+                            seq,
+                            g.name,
+                            g.brand_id,
+                            g.provider_id,
+                            g.product_id,
+                            _flag(g.has_demo),
+                            _flag(g.is_new),
+                            _flag(g.is_promo),
+                            _flag(g.is_hot),
+                            g.img,
+                            g.img_url,
+                            g.game_url,
+                            json.dumps(g.names, ensure_ascii=False) if g.names else None,
+                            now,
+                            now,
+                        ),
+                    )
+                    seq += 1
+                    db.execute("DELETE FROM game_categories WHERE game_id = ?", (g.id,))
+                    db.executemany(
+                        "INSERT INTO game_categories (game_id, pos, category_id) VALUES (?, ?, ?)",
+                        [(g.id, pos, c) for pos, c in enumerate(g.categories)],
+                    )
+                    db.executemany("INSERT OR IGNORE INTO categories (id) VALUES (?)", [(c,) for c in g.categories])
+                    n += 1
+                # Games are never deleted, so new rows are the whole difference.
+                added = db.execute("SELECT COUNT(*) FROM games").fetchone()[0] - before
+                db.execute("INSERT INTO scrapes (at, source, games, added) VALUES (?, ?, ?, ?)", (now, source, n, added))
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return {"games": n, "added": added}
+
+    def set_categories(self, categories: Iterable[Dict[str, Any]]) -> None:
+        """Names categories from `list_categories` output."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for c in categories:
+                    if c.get("id") is None:
+                        continue
+                    self._db.execute(
+                        "INSERT INTO categories (id, name, parent_id) VALUES (?, ?, ?)"
+                        " ON CONFLICT(id) DO UPDATE SET name = excluded.name, parent_id = excluded.parent_id",
+                        (c["id"], c.get("name"), c.get("parentId")),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def iter_games(
+        self,
+        brand_ids: Optional[List[int]] = None,
+        category_ids: Optional[List[int]] = None,
+        added_since: Optional[float] = None,
+        seen_since: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Game]:
+        """Games in store order, narrowed by brand, category and first/last-seen time."""
+        where: List[str] = []
+        params: List[Any] = []
+        if brand_ids:
+            where.append(f"g.brand_id IN ({','.join('?' * len(brand_ids))})")
+            params += brand_ids
+        if category_ids:
+            where.append(
+                f"g.id IN (SELECT game_id FROM game_categories WHERE category_id IN ({','.join('?' * len(category_ids))}))"
+            )
+            params += category_ids
+        if added_since is not None:
+            where.append("g.first_seen >= ?")
+            params.append(added_since)
+        if seen_since is not None:
+            where.append("g.last_seen >= ?")
+            params.append(seen_since)
+        sql = self._SELECT + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY g.seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            cur = self._db.execute(sql, params)
+            rows = cur.fetchmany(1000)
+        while rows:
+            for row in rows:
+                yield self._game(row)
+            with self._lock:
+                rows = cur.fetchmany(1000)
+
+    def ids(self) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self._db.execute("SELECT id FROM games ORDER BY seq")]
+
+    def game(self, game_id: int) -> Optional[Game]:
+        with self._lock:
+            row = self._db.execute(self._SELECT + " WHERE g.id = ?", (game_id,)).fetchone()
+        return None if row is None else self._game(row)
+
+
+class _DbRows(Sequence):
+    """The launcher's game rows served straight off a catalog database.
+
+    Only the ids are held in memory. Games are never deleted and new ones get
+    a higher seq, so the first len(self) rows in seq order stay these ids
+    even while a scrape writes to the file.
+    """
+
+    def __init__(self, db: _CatalogDb):
+        self.db = db
+        self._ids = db.ids()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, i: Any) -> Any:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        gid = self._ids[i]
+        g = self.db.game(gid)
+        return _launcher_row(gid, g._asdict() if g is not None else {})
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for g in self.db.iter_games(limit=len(self._ids)):
+            yield _launcher_row(g.id, g._asdict())
+
+
+class _IncrementalBaseline:
+    """A previous scrape used to cut a refresh short.
+
+    Category listings are assumed to be stable: once a whole page is made of
+    games that are already in the baseline with identical records, the games
+    listed after that page in the baseline are taken from it instead of being
+    fetched. Baseline games before it that the crawl did not see count as
+    removed.
+    """
+
+    def __init__(self, games: List[Game]):
+        self.games = games
+        self.by_id: Dict[int, Game] = {g.id: g for g in games}
+        self._by_category: Optional[Dict[int, List[Game]]] = None
+
+    def page_unchanged(self, cid: Optional[int], page_games: List[Game]) -> bool:
+        for g in page_games:
+            known = self.by_id.get(g.id)
+            if known is None:
+                return False
+            if cid is not None and cid not in g.categories:
+                g = g._replace(categories=sorted(set(g.categories) | {cid}))
+            if known.names is not None:
+                # Fresh pages carry one language; names are merged later.
+                g = g._replace(names=known.names)
+            if g != known:
+                return False
+        return True
+
+    def is_last_page(self, cid: Optional[int], page_games: List[Game]) -> bool:
+        return not page_games or self.page_unchanged(cid, page_games)
+
+    def carry_over(self, cid: Optional[int], last_page: List[Game], store: _GameStore) -> None:
+        if cid is None:
+            listing = self.games
+        else:
+            if self._by_category is None:
+                by_category: Dict[int, List[Game]] = {}
+                for g in self.games:
+                    for c in g.categories:
+                        by_category.setdefault(c, []).append(g)
+                self._by_category = by_category
+            listing = self._by_category.get(cid, [])
+        seen = {g.id for g in last_page}
+        end = max((i for i, g in enumerate(listing) if g.id in seen), default=-1)
+        store.add(g for g in listing[end + 1 :] if g.id not in store)
+
+
+def _catalog_delta(
+    baseline: List[Game],
+    games: List[Game],
+    category_ids: Optional[List[int]] = None,
+) -> Dict[str, List[int]]:
+    old = {g.id: g for g in baseline}
+    new = {g.id: g for g in games}
+    if category_ids:
+        wanted = set(category_ids)
+        scope = [gid for gid, g in old.items() if wanted.intersection(g.categories)]
+    else:
+        scope = list(old)
+    return {
+        "added": [gid for gid in new if gid not in old],
+        "removed": [gid for gid in scope if gid not in new],
+        "changed": [gid for gid, g in new.items() if gid in old and old[gid] != g],
+    }
 
 
-def list_categories_http(base_url: str, lang: str, retries: int, backoff_s: float) -> List[Dict[str, Any]]:
+def list_categories_http(
+    base_url: str,
+    lang: str,
+    retries: int,
+    backoff_s: float,
+    cache: Optional[_HttpCache] = None,
+) -> List[Dict[str, Any]]:
     base_url = base_url.rstrip("/")
-    opener = _make_http_opener(base_url, lang)
-    api_json = _get_options_http(opener, base_url=base_url, retries=retries, backoff_s=backoff_s)
+    session = _get_http_session(base_url, lang, warm_up=cache is None or not cache.offline)
+    api_json = _get_options_http(session, base_url=base_url, retries=retries, backoff_s=backoff_s, cache=cache)
 
     subs = api_json.get("subcategories") if isinstance(api_json, dict) else None
     if not isinstance(subs, list):
@@ -978,6 +3325,545 @@ def list_categories_http(base_url: str, lang: str, retries: int, backoff_s: floa
     return out
 
 
+def _category_ids_from_options(options: Dict[str, Any]) -> List[int]:
+    subs = options.get("subcategories")
+    if not isinstance(subs, list):
+        subs = []
+    ids: List[int] = []
+    for s in subs:
+        if not isinstance(s, dict):
+            continue
+        cid = _to_int(s.get("id"))
+        if cid is not None and cid > 0 and cid not in (998, 999):
+            ids.append(cid)
+    return sorted(set(ids))
+
+
+def _games_page_params(
+    cid: Optional[int],
+    brand_ids: Optional[List[int]],
+    title_search: Optional[str],
+    limit: int,
+    offset: int,
+) -> Dict[str, Any]:
+    return {
+        "brandIds": ",".join(str(x) for x in (brand_ids or [])) if brand_ids else "",
+        "categoriesId": str(cid) if cid is not None else "",
+        "limit": int(limit),
+        "offset": int(offset),
+        "titleSearch": title_search or "",
+        "withoutCdn": "true",
+        "filterType": "or",
+    }
+
+
+class _RateLimiter:
+    """Spaces request starts at least `interval_s` apart across all threads."""
+
+    def __init__(self, interval_s: float):
+        self.interval_s = max(0.0, float(interval_s))
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def reserve(self) -> float:
+        """Claim the next start slot; returns the seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval_s
+        return start_at - now
+
+    def wait(self) -> None:
+        if self.interval_s <= 0 and self._next_at <= time.monotonic():
+            return
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request start for at least `seconds`."""
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+_MAX_INTERVAL_S = 10.0
+# Errors and slow pages within this long of a slowdown are the same episode
+# (every worker in flight sees it) and do not slow down again.
+_SLOWDOWN_COOLDOWN_S = 1.0
+# Requests per second added to the rate after every good page.
+_RATE_STEP = 0.5
+
+
+class _AdaptiveController:
+    """Page size and request spacing tuned from how the API responds.
+
+    The page size grows while pages come back full and faster than
+    `target_latency_s`, and shrinks when they get slow or the server fails.
+    Request spacing shrinks a little after every good page and doubles on
+    errors, 429s and slow pages; a Retry-After pauses every worker. A short
+    page holding at least as many records as the largest size the server has
+    honoured so far may be a server-side cap rather than the end of the
+    listing, so callers check the following offset (see page_continues)
+    instead of skipping games.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        max_limit: int = 500,
+        interval_s: float = 0.0,
+        target_latency_s: float = 1.0,
+        min_limit: int = 10,
+    ):
+        self.start_limit = int(limit)
+        self.start_interval_s = max(0.0, float(interval_s))
+        self.max_limit = max(int(limit), int(max_limit))
+        self.min_limit = max(1, min(int(min_limit), int(limit)))
+        self.target_latency_s = float(target_latency_s)
+        self.limiter = _RateLimiter(interval_s)
+        self.cap: Optional[int] = None
+        # Largest page size the server is known to return in full.
+        self.honored = int(limit)
+        self.peak_limit = int(limit)
+        self.counts = {"grown": 0, "shrunk": 0, "errors": 0, "throttled": 0}
+        self._limit = float(limit)
+        self._slowed_at = 0.0
+        self._lock = threading.Lock()
+
+    def page_size(self) -> int:
+        with self._lock:
+            return int(self._limit)
+
+    def wait(self) -> None:
+        self.limiter.wait()
+
+    def delay(self) -> float:
+        return self.limiter.reserve()
+
+    def _slow_down(self, shrink: bool, factor: float = 2.0) -> None:
+        now = time.monotonic()
+        if now - self._slowed_at < _SLOWDOWN_COOLDOWN_S:
+            return
+        self._slowed_at = now
+        self.limiter.interval_s = min(_MAX_INTERVAL_S, max(self.limiter.interval_s * factor, 0.05))
+        if shrink and self._limit > self.min_limit:
+            self._limit = max(float(self.min_limit), self._limit * 0.75)
+            self.counts["shrunk"] += 1
+
+    def on_page(self, size: int, received: int, latency_s: float) -> None:
+        with self._lock:
+            if received >= size:
+                self.honored = max(self.honored, size)
+            if latency_s > self.target_latency_s:
+                self._slow_down(shrink=True)
+                return
+            ceiling = self.max_limit if self.cap is None else min(self.max_limit, self.cap)
+            if received >= size >= int(self._limit) and self._limit < ceiling:
+                self._limit = min(float(ceiling), self._limit * 1.25 + 1)
+                self.peak_limit = max(self.peak_limit, int(self._limit))
+                self.counts["grown"] += 1
+            # Slow start until the first slowdown, then additive increase of
+            # the request rate; _slow_down is the multiplicative decrease.
+            if self.limiter.interval_s > 0:
+                if self._slowed_at == 0.0:
+                    interval = self.limiter.interval_s * 0.9
+                else:
+                    interval = 1.0 / (1.0 / self.limiter.interval_s + _RATE_STEP)
+                self.limiter.interval_s = interval if interval >= 0.001 else 0.0
+
+    def on_error(self, status: int, retry_after_s: Optional[float]) -> None:
+        with self._lock:
+            self.counts["errors"] += 1
+            # 429 is an explicit "too fast"; anything else may as well be the
+            # page size or a transient failure.
+            if status == 429:
+                self._slow_down(shrink=False)
+            else:
+                self._slow_down(shrink=True, factor=1.5)
+            if retry_after_s:
+                self.counts["throttled"] += 1
+                self.limiter.pause(retry_after_s)
+
+    def page_continues(self, received: int, got: int, size: int) -> bool:
+        """Whether a page holding `got` of `size` records, the last response
+        `received` of them, may have been cut short by the server."""
+        if received <= 0 or got >= size:
+            return False
+        with self._lock:
+            # A cap is at least the largest page returned in full, so only a
+            # page shorter than that is certainly the end of the listing.
+            return received >= self.honored or (self.cap is not None and size > self.cap)
+
+    def capped_at(self, n: int) -> None:
+        with self._lock:
+            if self.cap is None or n < self.cap:
+                self.cap = n
+            self.honored = min(self.honored, n)
+            self._limit = min(self._limit, float(n))
+
+    def describe(self) -> str:
+        cap = f", server caps pages at {self.cap}" if self.cap is not None else ""
+        return (
+            f"Adaptive: page size {self.start_limit} -> {self.page_size()} (peak {self.peak_limit}{cap}), "
+            f"spacing {self.start_interval_s:.3f}s -> {self.limiter.interval_s:.3f}s, "
+            f"{self.counts['errors']} errors, {self.counts['throttled']} Retry-After pauses\n"
+        )
+
+
+def _is_empty_page(cid: Optional[int], page_games: List[Game]) -> bool:
+    return not page_games
+
+
+def _iter_pages_sequential(
+    fetch_page: Callable[[Optional[int], int, int], List[Game]],
+    category_ids: List[Optional[int]],
+    page_size: Callable[[], int],
+    sleep_s: float,
+    is_last_page: Callable[[Optional[int], List[Game]], bool] = _is_empty_page,
+    start_offsets: Optional[Dict[Optional[int], int]] = None,
+) -> Iterator[Tuple[Optional[int], int, int, List[Game]]]:
+    for cid in category_ids:
+        offset = (start_offsets or {}).get(cid, 0)
+        while True:
+            size = page_size()
+            page_games = fetch_page(cid, offset, size)
+            yield cid, offset, size, page_games
+            if is_last_page(cid, page_games):
+                break
+            offset += size
+            if sleep_s > 0:
+                time.sleep(sleep_s)
+
+
+def _iter_pages_concurrent(
+    fetch_page: Callable[[Optional[int], int, int], List[Game]],
+    category_ids: List[Optional[int]],
+    page_size: Callable[[], int],
+    sleep_s: float,
+    workers: int,
+    is_last_page: Callable[[Optional[int], List[Game]], bool] = _is_empty_page,
+    start_offsets: Optional[Dict[Optional[int], int]] = None,
+) -> Iterator[Tuple[Optional[int], int, int, List[Game]]]:
+    # Pages are fetched out of order by a bounded pool but yielded in exactly
+    # the (category, offset) order of _iter_pages_sequential. Slots are handed
+    # out breadth-first: every upcoming category gets one page in flight before
+    # any category gets a second, speculative one. The page size is fixed per
+    # submission, so offsets stay contiguous when page_size() changes.
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    limiter = _RateLimiter(sleep_s)
+
+    def _fetch(cid: Optional[int], offset: int, size: int) -> List[Game]:
+        limiter.wait()
+        return fetch_page(cid, offset, size)
+
+    n = len(category_ids)
+    pending: Dict[Tuple[int, int], Any] = {}
+    sizes: Dict[Tuple[int, int], int] = {}
+    queued = [0] * n
+    start_offsets = start_offsets or {}
+    first_offset = [start_offsets.get(cid, 0) for cid in category_ids]
+    next_offset = list(first_offset)
+    # Highest offset still worth fetching per category, learned from results.
+    last_offset: List[Optional[int]] = [None] * n
+    max_buffered = workers * 8
+    pool = ThreadPoolExecutor(max_workers=workers)
+
+    def _mark_end(ci: int, offset: int, size: int, fut: Any) -> None:
+        # A short page almost always ends a category, so only the page after it
+        # (which the sequential crawl would fetch and find empty) is still
+        # speculated. _fill keeps the current category's next page queued
+        # regardless, so a wrong guess only costs parallelism.
+        if fut.cancelled() or fut.exception() is not None:
+            return
+        page_games = fut.result()
+        if is_last_page(category_ids[ci], page_games):
+            stop = offset
+        elif len(page_games) < size:
+            stop = offset + size
+        else:
+            return
+        prev = last_offset[ci]
+        last_offset[ci] = stop if prev is None else min(prev, stop)
+
+    def _submit(ci: int) -> None:
+        offset = next_offset[ci]
+        size = page_size()
+        fut = pool.submit(_fetch, category_ids[ci], offset, size)
+        fut.add_done_callback(lambda f, ci=ci, offset=offset, size=size: _mark_end(ci, offset, size, f))
+        pending[(ci, offset)] = fut
+        sizes[(ci, offset)] = size
+        queued[ci] += 1
+        next_offset[ci] += size
+
+    def _fill(ci_out: int) -> None:
+        if queued[ci_out] == 0:
+            _submit(ci_out)
+        in_flight = sum(1 for f in pending.values() if not f.done())
+        for depth in range(1, workers + 1):
+            for ci in range(ci_out, n):
+                if in_flight >= workers:
+                    return
+                if len(pending) >= max_buffered and ci != ci_out:
+                    # Buffer full: only the category being drained may go deeper.
+                    break
+                stop = last_offset[ci]
+                if (stop is None or next_offset[ci] <= stop) and queued[ci] < depth:
+                    _submit(ci)
+                    in_flight += 1
+
+    try:
+        ci_out, off_out = 0, first_offset[0] if n else 0
+        while ci_out < n:
+            _fill(ci_out)
+            fut = pending[(ci_out, off_out)]
+            while not fut.done():
+                # Refill as soon as any fetch finishes, not just the one we yield next.
+                wait([f for f in pending.values() if not f.done()], return_when=FIRST_COMPLETED)
+                _fill(ci_out)
+            page_games = pending.pop((ci_out, off_out)).result()
+            size = sizes.pop((ci_out, off_out))
+            queued[ci_out] -= 1
+            yield category_ids[ci_out], off_out, size, page_games
+            if not is_last_page(category_ids[ci_out], page_games):
+                off_out += size
+                continue
+            for key in [k for k in pending if k[0] == ci_out]:
+                pending.pop(key).cancel()
+                sizes.pop(key, None)
+            ci_out += 1
+            off_out = first_offset[ci_out] if ci_out < n else 0
+    finally:
+        for f in pending.values():
+            f.cancel()
+        pool.shutdown(wait=True)
+
+
+# Games fetched from each category to check that its listing matches the
+# membership derived from the catalog.
+_PROBE_LIMIT = 10
+
+
+def _iter_pages_by_membership(
+    fetch_page: Callable[[Optional[int], int, int], List[Game]],
+    category_ids: List[Optional[int]],
+    page_size: Callable[[], int],
+    sleep_s: float,
+    workers: int,
+    is_last_page: Callable[[Optional[int], List[Game]], bool] = _is_empty_page,
+    start_offsets: Optional[Dict[Optional[int], int]] = None,
+) -> Iterator[Tuple[Optional[int], int, int, List[Game]]]:
+    # Every game lists its categories, so one pass over the unfiltered catalog
+    # says what each category holds. A small probe of each category's first
+    # page confirms it: the probe must list the category's catalog members in
+    # catalog order. A category that lists other games (a "virtual" listing
+    # such as new or popular) or sorts its own, which changes the record
+    # order, the --max cut and checkpoint offsets, is crawled page by page
+    # instead. Pages are yielded in the same (category, offset) order, and
+    # with the same contents, as the per-category iterators would produce.
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _pages(cids: List[Optional[int]], offsets: Optional[Dict[Optional[int], int]], last: Callable[..., bool]):
+        if workers > 1:
+            return _iter_pages_concurrent(fetch_page, cids, page_size, sleep_s, workers, last, offsets)
+        return _iter_pages_sequential(fetch_page, cids, page_size, sleep_s, last, offsets)
+
+    catalog = _GameStore()
+    listing = _pages([None], None, _is_empty_page)
+    try:
+        for _cid, _offset, _size, page_games in listing:
+            catalog.add(page_games)
+    finally:
+        listing.close()
+
+    members: Dict[Optional[int], List[Game]] = {cid: [] for cid in category_ids}
+    for g in catalog.games():
+        for c in g.categories:
+            if c in members:
+                members[c].append(g)
+
+    limiter = _RateLimiter(sleep_s)
+
+    def _probe(cid: Optional[int]) -> Optional[bool]:
+        # None: the listing is empty, whatever the catalog tags with it.
+        limiter.wait()
+        probe = fetch_page(cid, 0, _PROBE_LIMIT)
+        if not probe:
+            return None
+        expected = members[cid]
+        if len(probe) < _PROBE_LIMIT and len(expected) != len(probe):
+            return False
+        return [g.id for g in probe] == [g.id for g in expected[: len(probe)]]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        probed = dict(zip(category_ids, pool.map(_probe, category_ids)))
+    for cid in category_ids:
+        if probed[cid] is None:
+            members[cid] = []
+        elif probed[cid] is False:
+            del members[cid]
+    fallback = [cid for cid in category_ids if probed[cid] is False]
+    sys.stderr.write(
+        f"Membership plan: {len(members)} categories derived from {len(catalog)} catalog games, "
+        f"{len(fallback)} crawled page by page\n"
+    )
+
+    start_offsets = start_offsets or {}
+    crawled = _pages(fallback, start_offsets, is_last_page)
+    try:
+        for cid in category_ids:
+            if cid not in members:
+                for page in crawled:
+                    yield page
+                    if is_last_page(cid, page[3]):
+                        break
+                continue
+            offset = start_offsets.get(cid, 0)
+            while True:
+                size = page_size()
+                page_games = members[cid][offset : offset + size]
+                yield cid, offset, size, page_games
+                if is_last_page(cid, page_games):
+                    break
+                offset += size
+    finally:
+        crawled.close()
+
+
+async def _aiter_pages_batched(
+    fetch_batch: Callable[[List[Tuple[Optional[int], int, int]]], Awaitable[List[List[Game]]]],
+    category_ids: List[Optional[int]],
+    page_size: Callable[[], int],
+    batch_size: int,
+    is_last_page: Callable[[Optional[int], List[Game]], bool] = _is_empty_page,
+    start_offsets: Optional[Dict[Optional[int], int]] = None,
+) -> AsyncIterator[Tuple[Optional[int], int, int, List[Game]]]:
+    # Batched counterpart of _iter_pages_concurrent for the browser. Each round
+    # sends up to `batch_size` (category, offset, size) requests through one
+    # fetch_batch call, picked the same way: the page being waited for first,
+    # then breadth-first over the upcoming categories, never past a category's
+    # known end. Pages are yielded in _iter_pages_sequential order.
+    n = len(category_ids)
+    start_offsets = start_offsets or {}
+    first_offset = [start_offsets.get(cid, 0) for cid in category_ids]
+    next_offset = list(first_offset)
+    last_offset: List[Optional[int]] = [None] * n
+    fetched: Dict[Tuple[int, int], Tuple[int, List[Game]]] = {}
+    queued = [0] * n
+    max_buffered = batch_size * 8
+
+    def _plan(ci_out: int) -> List[Tuple[int, int, int]]:
+        batch: List[Tuple[int, int, int]] = []
+
+        def _add(ci: int) -> None:
+            size = page_size()
+            batch.append((ci, next_offset[ci], size))
+            next_offset[ci] += size
+            queued[ci] += 1
+
+        if queued[ci_out] == 0:
+            _add(ci_out)
+        for depth in range(1, batch_size + 1):
+            for ci in range(ci_out, n):
+                if len(batch) >= batch_size:
+                    return batch
+                if len(fetched) + len(batch) >= max_buffered and ci != ci_out:
+                    break
+                stop = last_offset[ci]
+                if (stop is None or next_offset[ci] <= stop) and queued[ci] < depth:
+                    _add(ci)
+        return batch
+
+    ci_out, off_out = 0, first_offset[0] if n else 0
+    while ci_out < n:
+        if (ci_out, off_out) not in fetched:
+            batch = _plan(ci_out)
+            results = await fetch_batch([(category_ids[ci], offset, size) for ci, offset, size in batch])
+            for (ci, offset, size), page_games in zip(batch, results):
+                fetched[(ci, offset)] = (size, page_games)
+                if is_last_page(category_ids[ci], page_games):
+                    stop = offset
+                elif len(page_games) < size:
+                    stop = offset + size
+                else:
+                    continue
+                prev = last_offset[ci]
+                last_offset[ci] = stop if prev is None else min(prev, stop)
+            continue
+        size, page_games = fetched.pop((ci_out, off_out))
+        queued[ci_out] -= 1
+        yield category_ids[ci_out], off_out, size, page_games
+        if not is_last_page(category_ids[ci_out], page_games):
+            off_out += size
+            continue
+        for key in [k for k in fetched if k[0] == ci_out]:
+            del fetched[key]
+        ci_out += 1
+        off_out = first_offset[ci_out] if ci_out < n else 0
+
+
+class _CrawlCheckpoint:
+    """Crawl progress per category, persisted as JSON so --resume can continue.
+
+    `key` identifies the crawl (site, filters, page size, output); a
+    checkpoint written for a different crawl is ignored. Progress is only
+    written to disk by save(), which callers invoke once the output file
+    holds everything recorded so far.
+    """
+
+    def __init__(self, path: str, key: Dict[str, Any]):
+        self.path = path
+        self.key = key
+        self.category_ids: Optional[List[Optional[int]]] = None
+        self.done: List[Optional[int]] = []
+        self.offsets: Dict[Optional[int], int] = {}
+        self.finished = False
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            sys.stderr.write(f"Ignoring checkpoint {self.path}: it belongs to a different crawl\n")
+            return False
+        self.category_ids = data.get("category_ids")
+        self.done = list(data.get("done") or [])
+        self.offsets = {(None if k == "null" else int(k)): int(v) for k, v in (data.get("offsets") or {}).items()}
+        return True
+
+    def pending_categories(self, category_ids: List[Optional[int]]) -> List[Optional[int]]:
+        done = set(self.done)
+        return [cid for cid in category_ids if cid not in done]
+
+    def record(self, cid: Optional[int], offset: int, limit: int, last: bool) -> None:
+        if last:
+            self.done.append(cid)
+            self.offsets.pop(cid, None)
+        else:
+            self.offsets[cid] = offset + limit
+
+    def save(self) -> None:
+        payload = {
+            "key": self.key,
+            "category_ids": self.category_ids,
+            "done": self.done,
+            "offsets": {("null" if k is None else str(k)): v for k, v in self.offsets.items()},
+            "updated_at": time.time(),
+        }
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, self.path)
+
+    def remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
 def scrape_games_http(
     base_url: str,
     lang: str,
@@ -990,60 +3876,170 @@ def scrape_games_http(
     sleep_s: float,
     retries: int,
     backoff_s: float,
+    workers: int = 1,
+    baseline: Optional["_IncrementalBaseline"] = None,
+    cache: Optional[_HttpCache] = None,
+    store: Optional[_GameStore] = None,
+    checkpoint: Optional[_CrawlCheckpoint] = None,
+    on_page: Optional[Callable[[], None]] = None,
+    metrics: Optional[_CrawlMetrics] = None,
+    controller: Optional[_AdaptiveController] = None,
+    plan: str = "categories",
+    stop: Optional[threading.Event] = None,
 ) -> List[Game]:
     base_url = base_url.rstrip("/")
-    opener = _make_http_opener(base_url, lang)
+    session = _get_http_session(base_url, lang, warm_up=cache is None or not cache.offline)
 
     resolved_category_ids: List[Optional[int]]
-    if all_categories:
-        options = _get_options_http(opener, base_url=base_url, retries=retries, backoff_s=backoff_s)
-        subs = options.get("subcategories")
-        if not isinstance(subs, list):
-            subs = []
-        ids: List[int] = []
-        for s in subs:
-            if not isinstance(s, dict):
-                continue
-            cid = _to_int(s.get("id"))
-            if cid is not None and cid > 0 and cid not in (998, 999):
-                ids.append(cid)
-        resolved_category_ids = sorted(set(ids))
+    if checkpoint is not None and checkpoint.category_ids is not None:
+        resolved_category_ids = list(checkpoint.category_ids)
+    elif all_categories:
+        options = _get_options_http(session, base_url=base_url, retries=retries, backoff_s=backoff_s, cache=cache)
+        resolved_category_ids = list(_category_ids_from_options(options))
     elif category_ids:
-        resolved_category_ids = category_ids
+        resolved_category_ids = list(category_ids)
     else:
         resolved_category_ids = [None]
 
-    collected: List[Game] = []
+    def _get_page(cid: Optional[int], offset: int, size: int) -> Tuple[List[Game], int]:
+        params = _games_page_params(cid, brand_ids, title_search, size, offset)
+        url = _build_api_url(base_url, "/web-api/tpmodels/games/1", params)
+        if metrics is None and controller is None:
+            api_json = _http_get_json_with_retries(session, url, retries=retries, backoff_s=backoff_s, cache=cache)
+            return _parse_games(api_json, base_url=base_url, lang=lang), 0
+        trace = _RequestTrace(url)
+        started_at = time.monotonic()
+        page_games: Optional[List[Game]] = None
+        try:
+            if controller is not None:
+                controller.wait()
+            api_json = _http_get_json_with_retries(
+                session, url, retries=retries, backoff_s=backoff_s, cache=cache, trace=trace, controller=controller
+            )
+            page_games = _parse_games(api_json, base_url=base_url, lang=lang)
+            received = _page_record_count(api_json)
+            if controller is not None and not trace.cached:
+                controller.on_page(size, received, trace.latency_s / max(1, trace.attempts))
+            return page_games, received
+        finally:
+            if metrics is not None:
+                metrics.record(cid, offset, trace, None if page_games is None else len(page_games), started_at)
+
+    def _fetch_page(cid: Optional[int], offset: int, size: int) -> List[Game]:
+        page_games, received = _get_page(cid, offset, size)
+        if controller is None:
+            return page_games
+        first = got = received
+        while controller.page_continues(received, got, size):
+            more, received = _get_page(cid, offset + got, size - got)
+            if received:
+                controller.capped_at(first)
+                page_games.extend(more)
+                got += received
+        return page_games
+
+    start_offsets: Dict[Optional[int], int] = {}
+    if checkpoint is not None:
+        checkpoint.category_ids = list(resolved_category_ids)
+        resolved_category_ids = checkpoint.pending_categories(resolved_category_ids)
+        start_offsets = dict(checkpoint.offsets)
+
+    is_last_page = baseline.is_last_page if baseline is not None else _is_empty_page
+    page_size = controller.page_size if controller is not None else lambda: limit
+    if controller is not None:
+        # The controller does the spacing.
+        sleep_s = 0.0
+    if plan == "membership" and resolved_category_ids and resolved_category_ids != [None]:
+        pages = _iter_pages_by_membership(
+            _fetch_page, resolved_category_ids, page_size, sleep_s, workers, is_last_page, start_offsets
+        )
+    elif workers > 1:
+        pages = _iter_pages_concurrent(
+            _fetch_page, resolved_category_ids, page_size, sleep_s, workers, is_last_page, start_offsets
+        )
+    else:
+        pages = _iter_pages_sequential(
+            _fetch_page, resolved_category_ids, page_size, sleep_s, is_last_page, start_offsets
+        )
+
+    collected = store if store is not None else _GameStore(max_games)
+    stopped = False
     try:
-        for cid in resolved_category_ids:
-            offset = 0
-            while not _cap_reached(len(collected), max_games):
-                params: Dict[str, Any] = {
-                    "brandIds": ",".join(str(x) for x in (brand_ids or [])) if brand_ids else "",
-                    "categoriesId": str(cid) if cid is not None else "",
-                    "limit": int(limit),
-                    "offset": int(offset),
-                    "titleSearch": title_search or "",
-                    "withoutCdn": "true",
-                    "filterType": "or",
-                }
-                url = _build_api_url(base_url, "/web-api/tpmodels/games/1", params)
-                api_json = _http_get_json_with_retries(opener, url, retries=retries, backoff_s=backoff_s)
-                page_games = _parse_games(api_json, base_url=base_url, lang=lang)
-
-                if not page_games:
+        if not collected.full():
+            for cid, offset, size, page_games in pages:
+                collected.add(page_games, category_id=cid)
+                last = is_last_page(cid, page_games)
+                if baseline is not None and page_games and last:
+                    baseline.carry_over(cid, page_games, collected)
+                if checkpoint is not None:
+                    checkpoint.record(cid, offset, size, last)
+                if on_page is not None:
+                    on_page()
+                if collected.full():
                     break
-
-                collected.extend(page_games)
-                collected = _dedupe(collected)
-
-                offset += limit
-                if sleep_s > 0:
-                    time.sleep(sleep_s)
+                if stop is not None and stop.is_set():
+                    stopped = True
+                    break
+        if checkpoint is not None and not stopped:
+            checkpoint.finished = True
     except KeyboardInterrupt:
         pass
+    finally:
+        pages.close()
+
+    return collected.games()
+
 
-    return collected if max_games <= 0 else collected[:max_games]
+# Nothing the crawl needs from the warm-up page load; fetch() calls made by
+# the crawl itself are never blocked.
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "font", "media"))
+
+
+async def _block_heavy_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _BrowserSession:
+    """A headless Chromium page on the site's /slots page, for API calls that
+    must come from the browser. One session can serve list_categories and
+    scrape_games in turn."""
+
+    def __init__(self, base_url: str, lang: str):
+        self.base_url = base_url.rstrip("/")
+        self.lang = lang
+        self.page: Any = None
+        self._playwright: Any = None
+        self._browser: Any = None
+
+    async def __aenter__(self) -> "_BrowserSession":
+        async_playwright = _async_playwright()
+        if async_playwright is None:
+            raise RuntimeError("Playwright is not installed. Use --mode http or install playwright.")
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            context = await self._browser.new_context()
+            await context.route("**/*", _block_heavy_resources)
+            self.page = await context.new_page()
+            await self.page.goto(f"{self.base_url}/{self.lang}/slots", wait_until="domcontentloaded")
+        except BaseException:
+            await self.close()
+            raise
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
 
 
 async def scrape_games(
@@ -1058,102 +4054,200 @@ async def scrape_games(
     sleep_s: float,
     retries: int,
     backoff_s: float,
+    baseline: Optional["_IncrementalBaseline"] = None,
+    store: Optional[_GameStore] = None,
+    checkpoint: Optional[_CrawlCheckpoint] = None,
+    on_page: Optional[Callable[[], None]] = None,
+    metrics: Optional[_CrawlMetrics] = None,
+    controller: Optional[_AdaptiveController] = None,
+    workers: int = 1,
+    browser: Optional[_BrowserSession] = None,
+    stop: Optional[threading.Event] = None,
 ) -> List[Game]:
+    import asyncio
+
+    if browser is None:
+        async with _BrowserSession(base_url, lang) as session:
+            return await scrape_games(
+                base_url,
+                lang,
+                category_ids,
+                all_categories,
+                brand_ids,
+                title_search,
+                limit,
+                max_games,
+                sleep_s,
+                retries,
+                backoff_s,
+                baseline=baseline,
+                store=store,
+                checkpoint=checkpoint,
+                on_page=on_page,
+                metrics=metrics,
+                controller=controller,
+                workers=workers,
+                browser=session,
+                stop=stop,
+            )
+
     base_url = base_url.rstrip("/")
+    page = browser.page
+    collected = store if store is not None else _GameStore(max_games)
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
-        await page.goto(f"{base_url}/{lang}/slots", wait_until="domcontentloaded")
-
-        collected: List[Game] = []
-
-        resolved_category_ids: List[Optional[int]]
-        if all_categories:
-            options = await _get_options(page, base_url=base_url, retries=retries, backoff_s=backoff_s)
-            subs = options.get("subcategories")
-            if not isinstance(subs, list):
-                subs = []
-            ids: List[int] = []
-            for s in subs:
-                if not isinstance(s, dict):
-                    continue
-                cid = _to_int(s.get("id"))
-                if cid is not None and cid > 0 and cid not in (998, 999):
-                    ids.append(cid)
-            resolved_category_ids = sorted(set(ids))
-        elif category_ids:
-            resolved_category_ids = category_ids
-        else:
-            resolved_category_ids = [None]
+    resolved_category_ids: List[Optional[int]]
+    if checkpoint is not None and checkpoint.category_ids is not None:
+        resolved_category_ids = list(checkpoint.category_ids)
+    elif all_categories:
+        options = await _get_options(page, base_url=base_url, retries=retries, backoff_s=backoff_s)
+        resolved_category_ids = list(_category_ids_from_options(options))
+    elif category_ids:
+        resolved_category_ids = list(category_ids)
+    else:
+        resolved_category_ids = [None]
 
+    start_offsets: Dict[Optional[int], int] = {}
+    if checkpoint is not None:
+        checkpoint.category_ids = list(resolved_category_ids)
+        resolved_category_ids = checkpoint.pending_categories(resolved_category_ids)
+        start_offsets = dict(checkpoint.offsets)
+
+    def _page_url(cid: Optional[int], offset: int, size: int) -> str:
+        params = _games_page_params(cid, brand_ids, title_search, size, offset)
+        return _build_api_url(base_url, "/web-api/tpmodels/games/1", params)
+
+    async def _settle(
+        cid: Optional[int], offset: int, size: int, result: Dict[str, Any], trace: _RequestTrace, started_at: float
+    ) -> Tuple[List[Game], int]:
+        # One batched attempt is in `result`; a failed one falls back to the
+        # single-request retry loop for the remaining attempts.
+        api_json = result.get("json")
         try:
-            for cid in resolved_category_ids:
-                offset = 0
-                while not _cap_reached(len(collected), max_games):
-                    params: Dict[str, Any] = {
-                        "brandIds": ",".join(str(x) for x in (brand_ids or [])) if brand_ids else "",
-                        "categoriesId": str(cid) if cid is not None else "",
-                        "limit": int(limit),
-                        "offset": int(offset),
-                        "titleSearch": title_search or "",
-                        "withoutCdn": "true",
-                        "filterType": "or",
-                    }
-
-                    url = _build_api_url(base_url, "/web-api/tpmodels/games/1", params)
-                    api_json = await _get_json_with_retries(page, url, retries=retries, backoff_s=backoff_s)
-                    page_games = _parse_games(api_json, base_url=base_url, lang=lang)
-
-                    if not page_games:
-                        break
-
-                    collected.extend(page_games)
-                    collected = _dedupe(collected)
-
-                    offset += limit
-                    if sleep_s > 0:
-                        await asyncio.sleep(sleep_s)
-        except KeyboardInterrupt:
-            pass
+            if int(result.get("status") or 0) != 200 or api_json is None:
+                trace.error = result.get("error") or f"status={result.get('status')}"
+                retry_after = _retry_after_s(result.get("retryAfter"))
+                if controller is not None:
+                    controller.on_error(trace.status, retry_after)
+                if retries <= 0:
+                    raise RuntimeError(f"Failed to fetch JSON: {trace.url} ({trace.error})")
+                delay = _backoff_delay(backoff_s, 0, retry_after)
+                await asyncio.sleep(delay)
+                trace.backoff_s += delay
+                api_json = await _get_json_with_retries(
+                    page, trace.url, retries=retries - 1, backoff_s=backoff_s, trace=trace, controller=controller
+                )
+        except Exception:
+            if metrics is not None:
+                metrics.record(cid, offset, trace, None, started_at)
+            raise
+        page_games = _parse_games(api_json, base_url=base_url, lang=lang)
+        received = _page_record_count(api_json)
+        if metrics is not None:
+            metrics.record(cid, offset, trace, len(page_games), started_at)
+        if controller is not None and trace.attempts == 1:
+            controller.on_page(size, received, trace.latency_s)
+        return page_games, received
+
+    async def _get_pages(requests: List[Tuple[Optional[int], int, int]]) -> List[Tuple[List[Game], int]]:
+        urls = [_page_url(cid, offset, size) for cid, offset, size in requests]
+        if controller is not None:
+            delay = 0.0
+            for _ in urls:
+                delay = controller.delay()
+            await asyncio.sleep(delay)
+        started_at = time.monotonic()
+        results = await _fetch_json_batch_via_page(page, urls)
+        elapsed = time.monotonic() - started_at
+        settled: List[Tuple[List[Game], int]] = []
+        for (cid, offset, size), url, result in zip(requests, urls, results):
+            trace = _RequestTrace(url)
+            trace.attempts = 1
+            trace.latency_s = elapsed
+            trace.status = int(result.get("status") or 0)
+            trace.bytes = int(result.get("bytes") or 0)
+            settled.append(await _settle(cid, offset, size, result, trace, started_at))
+        return settled
+
+    async def _fetch_batch(requests: List[Tuple[Optional[int], int, int]]) -> List[List[Game]]:
+        settled = await _get_pages(requests)
+        pages: List[List[Game]] = []
+        for (cid, offset, size), (page_games, received) in zip(requests, settled):
+            if controller is not None:
+                # See _AdaptiveController: a short page may be a server cap.
+                first = got = received
+                while controller.page_continues(received, got, size):
+                    [(more, received)] = await _get_pages([(cid, offset + got, size - got)])
+                    if received:
+                        controller.capped_at(first)
+                        page_games.extend(more)
+                        got += received
+            pages.append(page_games)
+        if sleep_s > 0 and controller is None:
+            # --sleep stays the average spacing between requests.
+            await asyncio.sleep(sleep_s * len(requests))
+        return pages
+
+    is_last_page = baseline.is_last_page if baseline is not None else _is_empty_page
+    page_size = controller.page_size if controller is not None else lambda: limit
+    pages = _aiter_pages_batched(
+        _fetch_batch, resolved_category_ids, page_size, max(1, workers), is_last_page, start_offsets
+    )
+    stopped = False
+    try:
+        if not collected.full():
+            async for cid, offset, size, page_games in pages:
+                collected.add(page_games, category_id=cid)
+                last = is_last_page(cid, page_games)
+                if baseline is not None and page_games and last:
+                    baseline.carry_over(cid, page_games, collected)
+                if checkpoint is not None:
+                    checkpoint.record(cid, offset, size, last)
+                if on_page is not None:
+                    on_page()
+                if collected.full():
+                    break
+                if stop is not None and stop.is_set():
+                    stopped = True
+                    break
+        if checkpoint is not None and not stopped:
+            checkpoint.finished = True
+    except KeyboardInterrupt:
+        pass
+    finally:
+        await pages.aclose()
 
-        await browser.close()
+    return collected.games()
 
-    return collected if max_games <= 0 else collected[:max_games]
 
+async def list_categories(
+    base_url: str,
+    lang: str,
+    retries: int,
+    backoff_s: float,
+    browser: Optional[_BrowserSession] = None,
+) -> List[Dict[str, Any]]:
+    if browser is None:
+        async with _BrowserSession(base_url, lang) as session:
+            return await list_categories(base_url, lang, retries, backoff_s, browser=session)
 
-async def list_categories(base_url: str, lang: str, retries: int, backoff_s: float) -> List[Dict[str, Any]]:
     base_url = base_url.rstrip("/")
+    api_json = await _get_options(browser.page, base_url=base_url, retries=retries, backoff_s=backoff_s)
 
-    if not _HAS_PLAYWRIGHT or async_playwright is None:
-        raise RuntimeError("Playwright is not installed. Use --mode http or install playwright.")
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-        page = await context.new_page()
-        await page.goto(f"{base_url}/{lang}/slots", wait_until="domcontentloaded")
-
-        api_json = await _get_options(page, base_url=base_url, retries=retries, backoff_s=backoff_s)
-
-        subs = api_json.get("subcategories") if isinstance(api_json, dict) else None
-        if not isinstance(subs, list):
-            subs = []
-
-        out: List[Dict[str, Any]] = []
-        for s in subs:
-            if not isinstance(s, dict):
-                continue
-            out.append(
-                {
-                    "id": _to_int(s.get("id")),
-                    "name": s.get("name") or s.get("title") or s.get("caption"),
-                    "parentId": _to_int(s.get("parentId")),
-                }
-            )
-        await browser.close()
+    subs = api_json.get("subcategories") if isinstance(api_json, dict) else None
+    if not isinstance(subs, list):
+        subs = []
 
+    out: List[Dict[str, Any]] = []
+    for s in subs:
+        if not isinstance(s, dict):
+            continue
+        out.append(
+            {
+                "id": _to_int(s.get("id")),
+                "name": s.get("name") or s.get("title") or s.get("caption"),
+                "parentId": _to_int(s.get("parentId")),
+            }
+        )
     return out
 
 
@@ -1161,6 +4255,8 @@ def _parse_args(argv: List[str]) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
     ap.add_argument("--base-url", default="https://melbet-tn.com")
     ap.add_argument("--lang", default="en")
+    ap.add_argument("--extra-lang", action="append", dest="extra_langs", help="also collect game names in this language (repeatable)")
+    ap.add_argument("--mirror", action="append", dest="mirrors", help="another base URL of the site to merge into the catalog (repeatable)")
 
     ap.add_argument("--mode", choices=["auto", "http", "playwright"], default="auto")
 
@@ -1175,19 +4271,52 @@ def _parse_args(argv: List[str]) -> argparse.Namespace:
     ap.add_argument("--category-id", type=int, action="append", dest="category_ids")
     ap.add_argument("--all-categories", action="store_true")
     ap.add_argument("--brand-id", type=int, action="append", dest="brand_ids")
+    ap.add_argument("--plan", choices=["categories", "membership"], default="categories", help="membership: fetch the unfiltered catalog once and derive each category from the games' categories (http mode)")
     ap.add_argument("--search", default=None)
 
     ap.add_argument("--limit", type=int, default=50)
     ap.add_argument("--max", type=int, default=1000, dest="max_games")
     ap.add_argument("--sleep", type=float, default=0.2)
+    ap.add_argument("--workers", type=int, default=1, help="concurrent page fetches (in playwright mode: pages fetched per in-page batch); --sleep is the global spacing between requests")
+    ap.add_argument("--adaptive", action="store_true", help="tune page size and request spacing from response times, errors and 429s (--limit and --sleep are the starting values)")
+    ap.add_argument("--max-limit", type=int, default=500, help="largest page size --adaptive may grow to")
+    ap.add_argument("--target-latency", type=float, default=1.0, help="seconds per page above which --adaptive shrinks pages and slows down")
 
     ap.add_argument("--retries", type=int, default=5)
     ap.add_argument("--backoff", type=float, default=0.75)
 
+    ap.add_argument("--cache", default=None, help="SQLite file caching API responses (http mode)")
+    ap.add_argument("--cache-ttl", type=float, default=3600.0, help="seconds a cached response is served without revalidation")
+    ap.add_argument("--from-cache", action="store_true", help="offline: serve only from --cache, never touch the network")
+    ap.add_argument("--http-stats", action="store_true", help="print request/handshake counters of the shared HTTP session on exit")
+    ap.add_argument("--metrics", action="store_true", help="print per-category request latency, retry and throughput metrics of the crawl")
+    ap.add_argument("--metrics-out", default=None, help="write the crawl metrics, including every page request, as JSON")
+
     ap.add_argument("--out", default="games.json")
-    ap.add_argument("--format", choices=["json", "csv"], default="json")
+    ap.add_argument("--format", choices=["json", "jsonl", "csv"], default="json")
+    ap.add_argument("--stream", action="store_true", help="write csv rows as pages arrive (jsonl always streams)")
+    ap.add_argument("--resume", action="store_true", help="continue an interrupted crawl from its checkpoint and the games already in --out")
+    ap.add_argument("--checkpoint", default=None, help="crawl checkpoint file (default: <out>.ckpt, removed once the crawl completes)")
+    ap.add_argument("--incremental", action="store_true", help="refresh against a previous JSON scrape, stopping each category at the first unchanged page")
+    ap.add_argument("--baseline", default=None, help="previous scrape for --incremental (default: --out)")
+    ap.add_argument("--delta-out", default=None, help="write added/removed/changed game ids as JSON")
     ap.add_argument("--balance", type=float, default=1000.0, help="initial virtual wallet balance")
 
+    ap.add_argument("--resolve-demos", default=None, metavar="CATALOG", help="resolve demo links for every has_demo game in a scraped JSON catalog")
+    ap.add_argument("--demo-store", default="demo_links.json", help="persistent game id -> demo url store, preloaded by --serve")
+    ap.add_argument("--demo-ttl", type=float, default=12 * 3600.0, help="seconds a stored demo link stays valid")
+    ap.add_argument("--mirror-images", default=None, metavar="CATALOG", help="download every game's thumbnail into the local image cache")
+    ap.add_argument("--image-dir", default="thumbs", help="content-addressed image cache, served by --serve under /img/<id>")
+
+    ap.add_argument("--convert-catalog", nargs=2, metavar=("IN", "OUT"), default=None, help="convert a catalog between formats by extension: json, jsonl, csv, .sqlite catalog database, anything else .melcat")
+    ap.add_argument("--catalog", default=None, help="catalog served by --serve (json, .melcat or .sqlite; default: first of all_games.melcat, all_games.sqlite, all_games.json, ...)")
+    ap.add_argument("--db", default=None, help="SQLite catalog database every scrape is merged into, keeping when each game was first and last seen")
+    ap.add_argument("--added-since", type=float, default=None, metavar="DAYS", help="--convert-catalog from a database: only games first seen in the last DAYS days")
+    ap.add_argument("--seen-since", type=float, default=None, metavar="DAYS", help="--convert-catalog from a database: only games seen by a scrape in the last DAYS days")
+    ap.add_argument("--reload-interval", type=float, default=2.0, help="seconds between checks of the served catalog for changes (0 disables reloading)")
+    ap.add_argument("--server", choices=["threading", "asyncio"], default="threading", help="launcher server: a thread per connection, or one asyncio loop with keep-alive")
+    ap.add_argument("--max-concurrency", type=int, default=64, help="requests handled at once by --server asyncio")
+
     ap.add_argument("--list-categories", action="store_true")
     ap.add_argument("--launch", type=int, help="launch browser with extension for specific game id")
     ap.add_argument("--test-extension", action="store_true", help="Run automated verification of extension integration")
@@ -1195,7 +4324,10 @@ def _parse_args(argv: List[str]) -> argparse.Namespace:
     return ap.parse_args(argv)
 
 async def launch_integrated_browser(args: argparse.Namespace) -> int:
-    if not _HAS_PLAYWRIGHT or async_playwright is None:
+    import asyncio
+
+    async_playwright = _async_playwright()
+    if async_playwright is None:
         print("Error: Playwright not found. Install it with: pip install playwright && playwright install chromium")
         return 1
 
@@ -1209,6 +4341,12 @@ async def launch_integrated_browser(args: argparse.Namespace) -> int:
             retries=args.retries,
             backoff_s=args.backoff,
             initial_balance=args.balance,
+            demo_store=_DemoLinkStore(args.demo_store, ttl_s=args.demo_ttl),
+            catalog_path=args.catalog,
+            reload_interval_s=args.reload_interval,
+            server=args.server,
+            max_concurrency=args.max_concurrency,
+            image_store=_ImageStore(args.image_dir),
         )
 
     t = threading.Thread(target=run_server, daemon=True)
@@ -1275,13 +4413,21 @@ async def launch_integrated_browser(args: argparse.Namespace) -> int:
 
 def main(argv: List[str]) -> int:
     args = _parse_args(argv)
+    try:
+        return _run(args)
+    finally:
+        if args.http_stats:
+            stats = _http_stats()
+            sys.stderr.write(
+                f"HTTP: {stats['requests']} requests, {stats['handshakes']} handshakes, {stats['reused']} reused connections\n"
+            )
 
+
+def _run(args: argparse.Namespace) -> int:
     if args.launch:
-        return asyncio.run(launch_integrated_browser(args))
+        import asyncio
 
-    mode = args.mode
-    if mode == "auto":
-        mode = "playwright" if _HAS_PLAYWRIGHT else "http"
+        return asyncio.run(launch_integrated_browser(args))
 
     if args.game_id is not None:
         if args.demo:
@@ -1296,6 +4442,8 @@ def main(argv: List[str]) -> int:
             url = f"{args.base_url.rstrip('/')}/{args.lang}/slots?game={int(args.game_id)}"
         sys.stdout.write(url + "\n")
         if args.open_game:
+            import webbrowser
+
             webbrowser.open(url, new=2)
         return 0
 
@@ -1308,20 +4456,339 @@ def main(argv: List[str]) -> int:
             retries=args.retries,
             backoff_s=args.backoff,
             initial_balance=args.balance,
+            demo_store=_DemoLinkStore(args.demo_store, ttl_s=args.demo_ttl),
+            catalog_path=args.catalog,
+            reload_interval_s=args.reload_interval,
+            server=args.server,
+            max_concurrency=args.max_concurrency,
+            image_store=_ImageStore(args.image_dir),
+        )
+        return 0
+
+    if args.convert_catalog:
+        src, dst = args.convert_catalog
+        if (args.added_since is not None or args.seen_since is not None) and not _is_catalog_db(src):
+            sys.stderr.write("--added-since and --seen-since need a catalog database (.sqlite) to convert from\n")
+            return 2
+        t0 = time.time()
+        n = _write_catalog(dst, _select_games(src, args))
+        dt = time.time() - t0
+        sys.stdout.write(f"Wrote {n} games to {dst} ({os.path.getsize(dst)} bytes) in {dt:.2f}s\n")
+        return 0
+
+    if args.mirror_images:
+        images = _ImageStore(args.image_dir)
+        t0 = time.time()
+        counts = mirror_images(
+            base_url=args.base_url,
+            lang=args.lang,
+            games=_read_games_file(args.mirror_images),
+            store=images,
+            retries=args.retries,
+            backoff_s=args.backoff,
+            workers=max(1, args.workers),
+            sleep_s=args.sleep,
+        )
+        dt = time.time() - t0
+        sys.stdout.write(
+            f"Mirrored {counts['downloaded']} images ({counts['bytes']} bytes, {counts['failed']} failed, "
+            f"{counts['skipped']} already cached) into {args.image_dir} in {dt:.2f}s\n"
+        )
+        return 0
+
+    if args.resolve_demos:
+        store = _DemoLinkStore(args.demo_store, ttl_s=args.demo_ttl)
+        t0 = time.time()
+        counts = resolve_demo_links(
+            base_url=args.base_url,
+            lang=args.lang,
+            games=_read_games_file(args.resolve_demos),
+            store=store,
+            retries=args.retries,
+            backoff_s=args.backoff,
+            workers=max(1, args.workers),
+            sleep_s=args.sleep,
+        )
+        dt = time.time() - t0
+        sys.stdout.write(
+            f"Resolved {counts['resolved']} demo links ({counts['failed']} failed, {counts['skipped']} still fresh) "
+            f"into {args.demo_store} in {dt:.2f}s\n"
         )
         return 0
 
+    mode = args.mode
+    cache: Optional[_HttpCache] = None
+    if args.plan == "membership":
+        if args.mode == "auto":
+            mode = "http"
+        elif mode != "http":
+            sys.stderr.write("--plan membership needs --mode http; crawling category by category\n")
+    if args.cache or args.from_cache:
+        if args.from_cache or args.mode == "auto":
+            mode = "http"
+        cache = _HttpCache(args.cache or "http_cache.sqlite", ttl_s=args.cache_ttl, offline=bool(args.from_cache))
+    if mode == "auto":
+        # Only settled here: everything above runs without Playwright.
+        mode = "playwright" if _async_playwright() is not None else "http"
+
     if args.list_categories:
         if mode == "http":
-            cats = list_categories_http(args.base_url, args.lang, retries=args.retries, backoff_s=args.backoff)
+            cats = list_categories_http(args.base_url, args.lang, retries=args.retries, backoff_s=args.backoff, cache=cache)
         else:
+            import asyncio
+
             cats = asyncio.run(list_categories(args.base_url, args.lang, retries=args.retries, backoff_s=args.backoff))
+        if args.db:
+            db = _CatalogDb(args.db)
+            try:
+                db.set_categories(cats)
+            finally:
+                db.close()
         sys.stdout.write(json.dumps(cats, ensure_ascii=False, indent=2) + "\n")
         return 0
 
+    baseline: Optional[_IncrementalBaseline] = None
+    if args.incremental:
+        baseline_path = args.baseline or args.out
+        try:
+            baseline = _IncrementalBaseline(_read_games_file(baseline_path))
+        except FileNotFoundError:
+            sys.stderr.write(f"No baseline at {baseline_path}; running a full crawl\n")
+            baseline = _IncrementalBaseline([])
+
+    checkpoint = _CrawlCheckpoint(args.checkpoint or f"{args.out}.ckpt", key=_checkpoint_key(args))
+    resumed = bool(args.resume) and checkpoint.load()
+
+    sources = _locale_sources(args)
+    localized = any(lang != args.lang for _base, lang in sources)
+
+    writer: Optional[_StreamWriter] = None
+    store = _GameStore(args.max_games)
+    if args.format == "jsonl" or (args.format == "csv" and args.stream):
+        writer = _StreamWriter(args.out, args.format, append=bool(args.resume), localized=localized)
+        store = _GameStore(args.max_games, on_add=writer.write, keep_records=False)
+        if args.resume and os.path.exists(args.out):
+            store.mark_seen(g.id for g in _iter_games_file(args.out))
+    elif resumed and os.path.exists(args.out):
+        store.add(_iter_games_file(args.out))
+
+    on_page: Optional[Callable[[], None]] = None
+    if writer is not None:
+        stream = writer
+        last_save = [time.monotonic()]
+
+        def _save_streamed_progress() -> None:
+            # The checkpoint must never get ahead of what is on disk.
+            if time.monotonic() - last_save[0] >= 2.0:
+                stream.flush()
+                checkpoint.save()
+                last_save[0] = time.monotonic()
+
+        on_page = _save_streamed_progress
+
+    def _write_output(games: List[Game]) -> int:
+        if writer is not None:
+            writer.close()
+            return writer.count
+        if args.format == "json":
+            _write_json(args.out, games)
+        else:
+            _write_csv(args.out, games, localized=localized)
+        return len(games)
+
+    metrics = _CrawlMetrics() if args.metrics or args.metrics_out else None
+    controller: Optional[_AdaptiveController] = None
+    if args.adaptive:
+        controller = _AdaptiveController(
+            args.limit, max_limit=args.max_limit, interval_s=args.sleep, target_latency_s=args.target_latency
+        )
+
+    locale_pool = None
+    locale_crawls: List[Tuple[str, str, Any]] = []
+    # Set when the main crawl is interrupted or fails, so the other passes
+    # end after their current page instead of running to completion.
+    locale_stop = threading.Event()
+    if sources:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Other languages and mirrors run alongside the main crawl.
+        locale_pool = ThreadPoolExecutor(max_workers=len(sources))
+        locale_crawls = [
+            (base, lang, locale_pool.submit(_crawl_locale, args, mode, base, lang, cache, locale_stop))
+            for base, lang in sources
+        ]
+
     t0 = time.time()
+    try:
+        games = _scrape(
+            args,
+            mode,
+            baseline=baseline,
+            cache=cache,
+            store=store,
+            checkpoint=checkpoint,
+            on_page=on_page,
+            metrics=metrics,
+            controller=controller,
+        )
+    except BaseException:
+        locale_stop.set()
+        if locale_pool is not None:
+            locale_pool.shutdown(wait=False, cancel_futures=True)
+        # Keep what we have and where we were, then let the error surface.
+        _write_output(store.games())
+        checkpoint.save()
+        sys.stderr.write(f"Crawl failed; progress saved to {checkpoint.path}, continue with --resume\n")
+        raise
+    finally:
+        if controller is not None:
+            sys.stderr.write(controller.describe())
+        if metrics is not None:
+            metrics.finish()
+            if args.metrics:
+                sys.stderr.write(metrics.report())
+            if args.metrics_out:
+                metrics.save(args.metrics_out)
+
+    if not checkpoint.finished:
+        locale_stop.set()
+    names: Dict[int, Dict[str, str]] = {}
+    extra_ids: Set[int] = set()
+    if locale_pool is not None:
+        main_base = args.base_url.rstrip("/")
+        for base, lang, fut in locale_crawls:
+            try:
+                source_games = fut.result()
+            except KeyboardInterrupt:
+                locale_stop.set()
+                locale_pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            except Exception as e:
+                sys.stderr.write(f"Skipping {base} [{lang}]: {e}\n")
+                continue
+            for g in source_games:
+                names.setdefault(g.id, {}).setdefault(lang, g.name)
+            if base != main_base:
+                # Another language of the main site only names its games;
+                # a mirror may also list games the main site does not.
+                extra_ids.update(g.id for g in store.add(source_games))
+        locale_pool.shutdown()
+        games = store.games()
+        if extra_ids:
+            sys.stderr.write(f"Mirrors added {len(extra_ids)} games missing from {args.base_url}\n")
+
+    def _localize(games: Iterable[Game]) -> Iterator[Game]:
+        for g in games:
+            localized_names = dict(names.get(g.id) or {})
+            if g.id not in extra_ids:
+                localized_names.pop(args.lang, None)
+                localized_names = {args.lang: g.name, **localized_names}
+            yield g._replace(names=localized_names) if localized_names else g
+
+    if localized and writer is None:
+        games = list(_localize(games))
+    written = _write_output(games)
+    if localized and writer is not None:
+        # Streamed records went out before the other languages were known.
+        tmp = f"{args.out}.tmp"
+        with _StreamWriter(tmp, args.format, localized=True) as localized_writer:
+            localized_writer.write(_localize(_iter_games_file(args.out)))
+        os.replace(tmp, args.out)
+    if checkpoint.finished:
+        checkpoint.remove()
+    else:
+        checkpoint.save()
+        sys.stderr.write(f"Crawl interrupted; progress saved to {checkpoint.path}, continue with --resume\n")
+    if writer is not None and baseline is not None:
+        games = _read_games_file(args.out)
+
+    dt = time.time() - t0
+    sys.stdout.write(f"Wrote {written} games to {args.out} in {dt:.2f}s\n")
+
+    if args.db:
+        db = _CatalogDb(args.db)
+        try:
+            stored = db.upsert(
+                games if writer is None else _iter_games_file(args.out),
+                source=f"{args.base_url.rstrip('/')} [{args.lang}]",
+            )
+        finally:
+            db.close()
+        sys.stdout.write(f"Stored {stored['games']} games in {args.db}, {stored['added']} of them new\n")
+
+    if baseline is not None:
+        category_ids = None if args.all_categories else args.category_ids
+        delta = _catalog_delta(baseline.games, games, category_ids)
+        sys.stdout.write(
+            f"Delta vs baseline: +{len(delta['added'])} -{len(delta['removed'])} ~{len(delta['changed'])}\n"
+        )
+        if args.delta_out:
+            with open(args.delta_out, "w", encoding="utf-8") as f:
+                json.dump(delta, f, indent=2)
+    return 0
+
+
+def _select_games(path: str, args: argparse.Namespace) -> Iterator[Game]:
+    """Games of a catalog file narrowed by --brand-id, --category-id and, for a database, --added-since/--seen-since."""
+    if _is_catalog_db(path):
+        now = time.time()
+        db = _CatalogDb(path, readonly=True)
+        try:
+            yield from db.iter_games(
+                brand_ids=args.brand_ids,
+                category_ids=args.category_ids,
+                added_since=None if args.added_since is None else now - args.added_since * 86400,
+                seen_since=None if args.seen_since is None else now - args.seen_since * 86400,
+            )
+        finally:
+            db.close()
+        return
+    brands = set(args.brand_ids or [])
+    categories = set(args.category_ids or [])
+    for g in _iter_games_file(path):
+        if brands and g.brand_id not in brands:
+            continue
+        if categories and not categories.intersection(g.categories):
+            continue
+        yield g
+
+
+def _write_catalog(path: str, games: Iterable[Game]) -> int:
+    """Writes games in the format the extension of `path` names; returns how many."""
+    lower = path.lower()
+    if _is_catalog_db(path):
+        db = _CatalogDb(path)
+        try:
+            return db.upsert(games, source="import")["games"]
+        finally:
+            db.close()
+    if lower.endswith(".jsonl"):
+        with _StreamWriter(path, "jsonl") as w:
+            w.write(games)
+        return w.count
+    games = list(games)
+    if lower.endswith(".json"):
+        _write_json(path, games)
+    elif lower.endswith(".csv"):
+        _write_csv(path, games, localized=any(g.names for g in games))
+    else:
+        _write_columnar(path, games)
+    return len(games)
+
+
+def _scrape(
+    args: argparse.Namespace,
+    mode: str,
+    baseline: Optional[_IncrementalBaseline],
+    cache: Optional[_HttpCache],
+    store: _GameStore,
+    checkpoint: Optional[_CrawlCheckpoint] = None,
+    on_page: Optional[Callable[[], None]] = None,
+    metrics: Optional[_CrawlMetrics] = None,
+    controller: Optional[_AdaptiveController] = None,
+) -> List[Game]:
     if mode == "http":
-        games = scrape_games_http(
+        return scrape_games_http(
             base_url=args.base_url,
             lang=args.lang,
             category_ids=args.category_ids,
@@ -1333,32 +4800,120 @@ def main(argv: List[str]) -> int:
             sleep_s=args.sleep,
             retries=args.retries,
             backoff_s=args.backoff,
+            workers=max(1, args.workers),
+            baseline=baseline,
+            cache=cache,
+            store=store,
+            checkpoint=checkpoint,
+            on_page=on_page,
+            metrics=metrics,
+            controller=controller,
+            plan=args.plan,
         )
-    else:
-        games = asyncio.run(
-            scrape_games(
-                base_url=args.base_url,
-                lang=args.lang,
-                category_ids=args.category_ids,
-                all_categories=bool(args.all_categories),
-                brand_ids=args.brand_ids,
-                title_search=args.search,
-                limit=args.limit,
-                max_games=args.max_games,
-                sleep_s=args.sleep,
-                retries=args.retries,
-                backoff_s=args.backoff,
-            )
+    import asyncio
+
+    return asyncio.run(
+        scrape_games(
+            base_url=args.base_url,
+            lang=args.lang,
+            category_ids=args.category_ids,
+            all_categories=bool(args.all_categories),
+            brand_ids=args.brand_ids,
+            title_search=args.search,
+            limit=args.limit,
+            max_games=args.max_games,
+            sleep_s=args.sleep,
+            retries=args.retries,
+            backoff_s=args.backoff,
+            baseline=baseline,
+            store=store,
+            checkpoint=checkpoint,
+            on_page=on_page,
+            metrics=metrics,
+            controller=controller,
+            workers=max(1, args.workers),
         )
+    )
 
-    if args.format == "json":
-        _write_json(args.out, games)
-    else:
-        _write_csv(args.out, games)
 
-    dt = time.time() - t0
-    sys.stdout.write(f"Wrote {len(games)} games to {args.out} in {dt:.2f}s\n")
-    return 0
+def _locale_sources(args: argparse.Namespace) -> List[Tuple[str, str]]:
+    """(base_url, lang) pairs crawled next to --base-url/--lang."""
+    bases = dict.fromkeys(b.rstrip("/") for b in [args.base_url] + list(args.mirrors or []))
+    langs = dict.fromkeys([args.lang] + list(args.extra_langs or []))
+    return [(b, lang) for b in bases for lang in langs][1:]
+
+
+def _crawl_locale(
+    args: argparse.Namespace,
+    mode: str,
+    base_url: str,
+    lang: str,
+    cache: Optional[_HttpCache],
+    stop: Optional[threading.Event] = None,
+) -> List[Game]:
+    # Categories and the other locale-independent fields come from the main
+    # crawl; this pass only contributes names and mirror-only games. An
+    # --all-categories run needs just the unfiltered listing, any other run
+    # the same category, brand and search filters and --max as the main one.
+    category_ids = None if args.all_categories else args.category_ids
+    if mode == "http":
+        return scrape_games_http(
+            base_url=base_url,
+            lang=lang,
+            category_ids=category_ids,
+            all_categories=False,
+            brand_ids=args.brand_ids,
+            title_search=args.search,
+            limit=args.limit,
+            max_games=args.max_games,
+            sleep_s=args.sleep,
+            retries=args.retries,
+            backoff_s=args.backoff,
+            workers=max(1, args.workers),
+            cache=cache,
+            stop=stop,
+        )
+    import asyncio
+
+    return asyncio.run(
+        scrape_games(
+            base_url=base_url,
+            lang=lang,
+            category_ids=category_ids,
+            all_categories=False,
+            brand_ids=args.brand_ids,
+            title_search=args.search,
+            limit=args.limit,
+            max_games=args.max_games,
+            sleep_s=args.sleep,
+            retries=args.retries,
+            backoff_s=args.backoff,
+            workers=max(1, args.workers),
+            stop=stop,
+        )
+    )
+
+
+def _checkpoint_key(args: argparse.Namespace) -> Dict[str, Any]:
+    key = {
+        "base_url": args.base_url.rstrip("/"),
+        "lang": args.lang,
+        "category_ids": args.category_ids,
+        "all_categories": bool(args.all_categories),
+        "brand_ids": args.brand_ids,
+        "search": args.search,
+        "limit": args.limit,
+        "max_games": args.max_games,
+        "format": args.format,
+        "out": os.path.abspath(args.out),
+    }
+    # Only set when used, so checkpoints of plain crawls still match.
+    if args.plan != "categories":
+        key["plan"] = args.plan
+    if args.extra_langs or args.mirrors:
+        key["extra_langs"] = args.extra_langs
+        key["mirrors"] = args.mirrors
+    return key
 
 
 if __name__ == "__main__":